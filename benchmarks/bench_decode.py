@@ -0,0 +1,98 @@
+# benchmarks\bench_decode.py
+"""
+Micro-benchmark of the response decoding path per route.
+
+Compares the old `json.loads(response.text)` path with decoding straight from
+`response.content`, using json and (if installed) orjson, on synthetic payloads
+shaped like the largest Nobitex responses.
+
+Usage:
+    python benchmarks/bench_decode.py [--repeat 50]
+"""
+import argparse, json, random, timeit
+from requests import Response
+from requests.utils import get_encoding_from_headers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _orderbook(levels: int = 500) -> dict:
+    mid = 6_500_000_000
+    return {
+        'status': 'ok',
+        'lastUpdate': 1700000000000,
+        'lastTradePrice': str(mid),
+        'asks': [[str(mid + i * 10_000), f'{random.random():.6f}'] for i in range(1, levels)],
+        'bids': [[str(mid - i * 10_000), f'{random.random():.6f}'] for i in range(1, levels)],
+    }
+
+def _udf_history(bars: int = 5000) -> dict:
+    return {
+        's': 'ok',
+        't': [1700000000 + i * 60 for i in range(bars)],
+        'o': [random.uniform(6e9, 7e9) for _ in range(bars)],
+        'h': [random.uniform(6e9, 7e9) for _ in range(bars)],
+        'l': [random.uniform(6e9, 7e9) for _ in range(bars)],
+        'c': [random.uniform(6e9, 7e9) for _ in range(bars)],
+        'v': [random.uniform(0, 10) for _ in range(bars)],
+    }
+
+def _trades_list(trades: int = 1000) -> dict:
+    return {
+        'status': 'ok',
+        'hasNext': True,
+        'trades': [{
+            'id': 1000 + i,
+            'orderId': 5000 + i,
+            'srcCurrency': 'Bitcoin',
+            'dstCurrency': 'ریال',
+            'market': 'BTC-RLS',
+            'timestamp': '2024-01-01T12:00:00.000000+00:00',
+            'type': random.choice(['buy', 'sell']),
+            'price': f'{random.uniform(6e9, 7e9):.0f}',
+            'amount': f'{random.random():.6f}',
+            'total': f'{random.uniform(1e8, 1e9):.0f}',
+            'fee': '0.000012',
+        } for i in range(trades)],
+    }
+
+PAYLOADS = {
+    '/v3/orderbook': _orderbook,
+    '/market/udf/history': _udf_history,
+    '/market/trades/list': _trades_list,
+}
+
+def _response(payload: dict) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = 'application/json'
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = json.dumps(payload, ensure_ascii=False).encode()
+    return response
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    decoders = {
+        'json.loads(text)': lambda r: json.loads(r.text),
+        'json.loads(content)': lambda r: json.loads(r.content),
+    }
+    if orjson is not None:
+        decoders['orjson.loads(content)'] = lambda r: orjson.loads(r.content)
+
+    for route, factory in PAYLOADS.items():
+        response = _response(factory())
+        print(f'{route} ({len(response.content) / 1024:.0f} KiB)')
+
+        baseline = None
+        for name, decoder in decoders.items():
+            seconds = min(timeit.repeat(lambda: decoder(response), number=args.repeat, repeat=5)) / args.repeat
+            baseline = baseline or seconds
+            print(f'    {name:<24} {seconds * 1000:8.3f} ms  x{baseline / seconds:.2f}')
+
+if __name__ == '__main__':
+    main()
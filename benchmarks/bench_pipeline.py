@@ -0,0 +1,272 @@
+# benchmarks\bench_pipeline.py
+"""
+Offline benchmark of the whole request pipeline per route.
+
+Runs the client against an in-process HTTP stand-in (stdlib http.server on
+127.0.0.1) that serves pre-encoded payloads shaped like recorded Nobitex
+responses, so the numbers are what the client itself costs per call: header
+and URL building, the requests session, retries/breaker bookkeeping, JSON
+decoding and the output conversion. No network access is needed.
+
+Modes:
+    sync        one call at a time, no caching
+    cached      memory cache tier hit on every call after the first
+    sqlite      requests_cache persistent cache hit (skipped without requests_cache)
+    concurrent  --workers threads sharing one client
+    verbose     like sync with verbose=True, printed output sent to /dev/null
+
+Latency percentiles (ms) and throughput (calls/s) are printed per route and
+mode. --json writes them machine-readable; --baseline compares the median
+latency with an earlier --json file and exits with status 1 when a route got
+slower than --tolerance.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--calls 300] [--workers 8] [--modes sync,cached]
+                                        [--json results.json] [--baseline old.json] [--tolerance 0.25]
+"""
+import argparse, contextlib, json, os, platform, random, statistics, sys, tempfile, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+from nobitex_api import CachePolicy, CurrencyManager as CM, NobitexClient, version
+
+MODES = ('sync', 'cached', 'sqlite', 'concurrent', 'verbose')
+
+def _orderbook(levels: int = 100) -> dict:
+    mid = 6_500_000_000
+    return {
+        'status': 'ok',
+        'lastUpdate': 1700000000000,
+        'lastTradePrice': str(mid),
+        'asks': [[str(mid + i * 10_000), f'{random.random():.6f}'] for i in range(1, levels)],
+        'bids': [[str(mid - i * 10_000), f'{random.random():.6f}'] for i in range(1, levels)],
+    }
+
+def _trades(count: int = 100) -> dict:
+    return {
+        'status': 'ok',
+        'trades': [{
+            'time': 1700000000000 - i * 1000,
+            'price': f'{random.uniform(6e9, 7e9):.0f}',
+            'volume': f'{random.random():.6f}',
+            'type': random.choice(['buy', 'sell']),
+        } for i in range(count)],
+    }
+
+def _stats() -> dict:
+    stats = {}
+    for currency in CM.currencies()[:40]:
+        for quote in ('rls', 'usdt'):
+            latest = random.uniform(1, 1e9)
+            stats[f'{currency.symbol}-{quote}'] = {
+                'isClosed': False,
+                'bestSell': f'{latest * 1.001:.2f}',
+                'bestBuy': f'{latest * 0.999:.2f}',
+                'volumeSrc': f'{random.uniform(0, 1e4):.4f}',
+                'volumeDst': f'{random.uniform(0, 1e12):.2f}',
+                'latest': f'{latest:.2f}',
+                'mark': f'{latest:.2f}',
+                'dayLow': f'{latest * 0.97:.2f}',
+                'dayHigh': f'{latest * 1.03:.2f}',
+                'dayOpen': f'{latest * 0.99:.2f}',
+                'dayClose': f'{latest:.2f}',
+                'dayChange': f'{random.uniform(-5, 5):.2f}',
+            }
+    return {'status': 'ok', 'stats': stats}
+
+def _udf_history(bars: int = 500) -> dict:
+    return {
+        's': 'ok',
+        't': [1700000000 + i * 60 for i in range(bars)],
+        'o': [round(random.uniform(6e9, 7e9)) for _ in range(bars)],
+        'h': [round(random.uniform(6e9, 7e9)) for _ in range(bars)],
+        'l': [round(random.uniform(6e9, 7e9)) for _ in range(bars)],
+        'c': [round(random.uniform(6e9, 7e9)) for _ in range(bars)],
+        'v': [round(random.uniform(0, 10), 6) for _ in range(bars)],
+    }
+
+# Payload served for every path starting with the prefix, and the client call that requests it
+PAYLOADS = {
+    '/v3/orderbook/': _orderbook,
+    '/v2/depth/': _orderbook,
+    '/v2/trades/': _trades,
+    '/market/stats': _stats,
+    '/market/udf/history': _udf_history,
+}
+
+ROUTES = {
+    'Orderbook.get_orders': ('/v3/orderbook/', lambda client: client.Orderbook.get_orders(CM.btc)),
+    'Depth.get_depth': ('/v2/depth/', lambda client: client.Depth.get_depth(CM.btc)),
+    'Trades.get_trades': ('/v2/trades/', lambda client: client.Trades.get_trades(CM.btc)),
+    'Market.get_stats': ('/market/stats', lambda client: client.Market.get_stats()),
+    'Market.get_udf_history': ('/market/udf/history', lambda client: client.Market.get_udf_history(CM.btc, 'irt', '1', to=1700030000)),
+}
+
+class MockAPI(ThreadingHTTPServer):
+    """
+    Serves the encoded PAYLOADS over keep-alive HTTP/1.1 connections on a random local port.
+    """
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        random.seed(0)
+        self.bodies = {prefix: json.dumps(factory()).encode() for prefix, factory in PAYLOADS.items()}
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.url = f'http://127.0.0.1:{self.server_address[1]}'
+        threading.Thread(target=self.serve_forever, name='mock-api', daemon=True).start()
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, without TCP_NODELAY every response waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def _reply(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split('?', 1)[0]
+        body = next((body for prefix, body in self.server.bodies.items() if path.startswith(prefix)), None)
+        status = 200 if body is not None else 404
+        body = body if body is not None else b'{"status": "failed", "message": "not recorded"}'
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+def _client(url: str, mode: str, cache_dir: str) -> NobitexClient:
+    client = NobitexClient(token='token', api_url=url, verbose=mode == 'verbose')
+    if mode in ('cached', 'sqlite'):
+        client.set_cache_policies({prefix: CachePolicy(3600) for prefix in PAYLOADS})
+    if mode == 'cached':
+        client.enable_memory_cache(expire_after=3600)
+    elif mode == 'sqlite':
+        client.enable_caching(expire_after=3600, cache_name=os.path.join(cache_dir, 'bench'))
+    return client
+
+def _timed(call) -> float:
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+def run(server: MockAPI, route: str, mode: str, calls: int, workers: int, cache_dir: str) -> dict:
+    """
+    Latency percentiles and throughput of `calls` calls of a route in one mode.
+    """
+    client = _client(server.url, mode, cache_dir)
+    prefix, call = ROUTES[route]
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull) if mode == 'verbose' else contextlib.nullcontext():
+        # Warm up the connection pool, the lazy route objects and the caches
+        for _ in range(min(10, calls)):
+            call(client)
+
+        start = time.perf_counter()
+        if mode == 'concurrent':
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                latencies = list(executor.map(lambda _: _timed(lambda: call(client)), range(calls)))
+        else:
+            latencies = [_timed(lambda: call(client)) for _ in range(calls)]
+        elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        'route': route,
+        'mode': mode,
+        'calls': calls,
+        'workers': workers if mode == 'concurrent' else 1,
+        'bytes': len(server.bodies[prefix]),
+        'p50_ms': cuts[49] * 1000,
+        'p90_ms': cuts[89] * 1000,
+        'p99_ms': cuts[98] * 1000,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'max_ms': max(latencies) * 1000,
+        'throughput': calls / elapsed,
+    }
+
+def compare(results: list, baseline_path: str, tolerance: float, out=sys.stdout) -> bool:
+    """
+    Print the median latency change against a baseline file, False if a route regressed beyond tolerance.
+    """
+    with open(baseline_path) as file:
+        baseline = {(r['route'], r['mode']): r for r in json.load(file)['results']}
+
+    ok = True
+    print(f'\nagainst {baseline_path} (tolerance {tolerance:.0%})', file=out)
+    for result in results:
+        before = baseline.get((result['route'], result['mode']))
+        if before is None:
+            continue
+        change = result['p50_ms'] / before['p50_ms'] - 1
+        regressed = change > tolerance
+        ok = ok and not regressed
+        print(f"    {result['route']:<24} {result['mode']:<11} p50 {change:+8.1%}{'  REGRESSION' if regressed else ''}", file=out)
+    return ok
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=300)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument('--routes', default=','.join(ROUTES))
+    parser.add_argument('--json', help='write the results to this file, - for stdout')
+    parser.add_argument('--baseline', help='results file of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    modes = [mode for mode in args.modes.split(',') if mode]
+    if 'sqlite' in modes:
+        try:
+            import requests_cache  # noqa: F401
+        except ImportError:
+            modes.remove('sqlite')
+            print('requests_cache not installed, skipping sqlite mode', file=sys.stderr)
+
+    server = MockAPI()
+    # Tables go to stderr when the JSON goes to stdout
+    out = sys.stderr if args.json == '-' else sys.stdout
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for route in args.routes.split(','):
+            print(route, file=out)
+            for mode in modes:
+                result = run(server, route, mode, args.calls, args.workers, cache_dir)
+                results.append(result)
+                print(
+                    f"    {mode:<11} p50 {result['p50_ms']:7.3f} ms  p90 {result['p90_ms']:7.3f} ms  "
+                    f"p99 {result['p99_ms']:7.3f} ms  {result['throughput']:9.0f} calls/s",
+                    file=out,
+                )
+    server.shutdown()
+
+    report = {
+        'nobitex_api': version,
+        'requests': requests.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'calls': args.calls,
+        'workers': args.workers,
+        'results': results,
+    }
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline and not compare(results, args.baseline, args.tolerance, out):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
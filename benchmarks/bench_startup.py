@@ -0,0 +1,67 @@
+# benchmarks\bench_startup.py
+"""
+Startup benchmark: package import time and client construction time.
+
+Each import is measured in a fresh interpreter. The heaviest third-party
+modules loaded by `import nobitex_api` are listed from `-X importtime`, so
+an eager import creeping back in shows up here.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--clients 1000]
+"""
+import argparse, os, statistics, subprocess, sys, timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_SNIPPET = 'import time; t = time.perf_counter(); import nobitex_api; print(time.perf_counter() - t)'
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, 'PYTHONPATH': ROOT + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+def import_times(runs: int) -> list:
+    return [float(_run('-c', _IMPORT_SNIPPET).stdout) for _ in range(runs)]
+
+def heaviest_imports(count: int = 8) -> list:
+    """
+    (cumulative microseconds, module) of the slowest top-level packages imported by nobitex_api.
+    """
+    stderr = _run('-X', 'importtime', '-c', 'import nobitex_api').stderr
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line[len('import time:'):].split('|'))
+        package = module.split('.')[0]
+        if package != 'nobitex_api' and not module.startswith(' '):
+            packages[package] = max(packages.get(package, 0), int(cumulative))
+    return sorted(((us, package) for package, us in packages.items()), reverse=True)[:count]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--clients', type=int, default=1000)
+    args = parser.parse_args()
+
+    times = import_times(args.runs)
+    print(f'import nobitex_api       median {statistics.median(times) * 1000:8.2f} ms  min {min(times) * 1000:8.2f} ms')
+
+    loaded = _run('-c', 'import sys, nobitex_api; print(",".join(m for m in ("requests_cache", "aiohttp", "numpy", "websockets") if m in sys.modules))')
+    print(f'    loaded optional deps: {loaded.stdout.strip() or "none"}')
+    for us, package in heaviest_imports():
+        print(f'    {package:<20} {us / 1000:8.2f} ms')
+
+    sys.path.insert(0, ROOT)
+    from nobitex_api import NobitexClient
+
+    construct = min(timeit.repeat(lambda: NobitexClient(token='token'), number=args.clients, repeat=5)) / args.clients
+    print(f'NobitexClient()          {construct * 1e6:8.2f} us')
+
+    def first_route() -> None:
+        NobitexClient(token='token').Market
+
+    first = min(timeit.repeat(first_route, number=args.clients, repeat=5)) / args.clients
+    print(f'NobitexClient().Market   {first * 1e6:8.2f} us')
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,69 @@
 # nobitex_api\__init__.py
+import importlib
+from typing import TYPE_CHECKING
+
 from ._nobitex_client import NobitexClient
 from ._currency import CurrencyManager
-from ._url import NobitexAPI, TestNobitexAPI
+from ._order_book import OrderBook, OrderBookSide
+from ._models import BookSnapshot, PriceLevels, Trade, MarketStats, Order
+from ._arrays import BookArrays
+from ._candle_store import CandleStore
+from ._trade_tail import TradeTail
+from ._order_tracker import OrderTracker, OrderEvent
+from ._portfolio import Portfolio
+from ._stats_table import StatsTable
+from ._retry import RetryPolicy, CircuitBreaker
+from ._cache_policy import CachePolicy
+from ._exceptions import NobitexException, CircuitOpenError
+from ._url import NobitexAPI, TestNobitexAPI, NobitexWebSocketURL
 from .__version__ import __version__ as version
 
+if TYPE_CHECKING:
+    from ._arrays import TRADE_DTYPE
+    from ._async_nobitex_client import AsyncNobitexClient
+    from ._websocket import NobitexWebSocket
+
+# Loaded on first access, they import the aiohttp, websockets and numpy extras
+_LAZY = {
+    'AsyncNobitexClient': '._async_nobitex_client',
+    'NobitexWebSocket': '._websocket',
+    'TRADE_DTYPE': '._arrays',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'NobitexClient',
+    'AsyncNobitexClient',
     'CurrencyManager',
+    'OrderBook',
+    'OrderBookSide',
+    'BookSnapshot',
+    'PriceLevels',
+    'Trade',
+    'MarketStats',
+    'Order',
+    'BookArrays',
+    'TRADE_DTYPE',
+    'CandleStore',
+    'TradeTail',
+    'OrderTracker',
+    'OrderEvent',
+    'Portfolio',
+    'StatsTable',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CachePolicy',
+    'NobitexException',
+    'CircuitOpenError',
     'NobitexAPI',
     'TestNobitexAPI',
+    'NobitexWebSocketURL',
+    'NobitexWebSocket',
     'version',
 ]
\ No newline at end of file
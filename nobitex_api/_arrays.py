@@ -0,0 +1,96 @@
+# nobitex_api\_arrays.py
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_TRADE_DTYPE = None
+
+def _require_numpy():
+    """
+    Import numpy on first use, it is an optional extra and too slow to load with the package.
+
+    Returns:
+        module: numpy.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for array output, install it with `pip install py-nobitex-api[numpy]`.") from None
+    return numpy
+
+def _trade_dtype() -> 'np.dtype':
+    """
+    Structured dtype of trades, side is 1 for buy and -1 for sell.
+    """
+    global _TRADE_DTYPE
+    if _TRADE_DTYPE is None:
+        _TRADE_DTYPE = _require_numpy().dtype([('time', 'i8'), ('price', 'f8'), ('volume', 'f8'), ('side', 'i1')])
+    return _TRADE_DTYPE
+
+def __getattr__(name: str) -> Any:
+    # TRADE_DTYPE is built on first access, with numpy
+    if name == 'TRADE_DTYPE':
+        return _trade_dtype()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Columns of udf/history candles
+CANDLE_COLUMNS = ('t', 'o', 'h', 'l', 'c', 'v')
+
+class BookArrays(NamedTuple):
+    """
+    Orderbook or depth snapshot as contiguous float64 arrays, best level first.
+    Returned by `Orderbook.get_orders` and `Depth.get_depth` with output='array'.
+    """
+    bid_prices: Any
+    bid_volumes: Any
+    ask_prices: Any
+    ask_volumes: Any
+    last_update: Optional[int] = None
+
+def levels_to_arrays(levels: List[List[str]]) -> tuple:
+    """
+    Convert [price, volume] string pairs to contiguous price and volume arrays.
+
+    Args:
+        levels (List[List[str]]): Levels as returned by the API.
+
+    Returns:
+        tuple: (prices, volumes) float64 arrays.
+    """
+    np = _require_numpy()
+    if not levels:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+    # One parsing pass to a (n, 2) array, transposed into two contiguous rows
+    prices, volumes = np.array(levels, dtype=np.float64)[:, :2].T.copy()
+    return prices, volumes
+
+def book_to_arrays(data: dict) -> BookArrays:
+    """
+    Convert an orderbook or depth response to BookArrays.
+    """
+    bid_prices, bid_volumes = levels_to_arrays(data.get('bids', []))
+    ask_prices, ask_volumes = levels_to_arrays(data.get('asks', []))
+    return BookArrays(bid_prices, bid_volumes, ask_prices, ask_volumes, data.get('lastUpdate'))
+
+def trades_to_array(data: dict) -> 'np.ndarray':
+    """
+    Convert a trades response to a structured array of TRADE_DTYPE (time, price, volume, side).
+    Returned by `Trades.get_trades` with output='array'.
+    """
+    np = _require_numpy()
+    return np.array(
+        [(trade['time'], trade['price'], trade['volume'], 1 if trade['type'] == 'buy' else -1) for trade in data.get('trades', [])],
+        dtype=_trade_dtype(),
+    )
+
+def candles_to_arrays(data: dict) -> Dict[str, 'np.ndarray']:
+    """
+    Convert udf/history candle columns to arrays, int64 for 't' and float64 for the others.
+    """
+    np = _require_numpy()
+    return {
+        column: np.asarray(data.get(column, []), dtype=np.int64 if column == 't' else np.float64)
+        for column in CANDLE_COLUMNS
+    }
@@ -0,0 +1,305 @@
+# nobitex_api\_async_nobitex_client.py
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+from datetime import timedelta
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from ._coalesce import request_key
+from ._nobitex_client import NobitexClient
+from ._url import NobitexAPI
+from ._type_hints import RequestMethod
+
+class AsyncNobitexClient(NobitexClient):
+    """
+    Asyncio version of NobitexClient.
+    Every route method returns an awaitable, and all requests share one keep-alive connection pool.
+
+    Usage:
+        async with AsyncNobitexClient(token=token) as client:
+            stats = await client.Market.get_stats()
+    """
+    def __init__(
+                self,
+                username: Optional[str] = '',
+                password: Optional[str] = '',
+                token: Optional[str] = '',
+                api_url: str = NobitexAPI,
+                verbose: bool = False,
+                timeout: Optional[float] = None,
+                json_decoder: Optional[Callable[[bytes], Any]] = None,
+                connection_limit: int = 100,
+                keepalive_timeout: float = 30,
+            ) -> None:
+        """
+        Initialize the AsyncNobitexClient.
+
+        Args:
+            username (str): The username for authentication.
+            password (str): The password for authentication.
+            api_url (str): URL of the Nobitex API, if you dont use the cloud version specify the local server.
+            verbose (bool): Prints the response from the API. Defaults to False. Not Recommended
+            timeout (float): Seconds to wait for the server before giving up on a request. Defaults to None (aiohttp default).
+            json_decoder (Callable[[bytes], Any]): Parses response bodies straight from bytes. Defaults to orjson.loads
+                if orjson is installed, otherwise json.loads.
+            connection_limit (int): Maximum number of simultaneous connections in the pool. Defaults to 100.
+            keepalive_timeout (float): Seconds an idle connection is kept open. Defaults to 30.
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncNobitexClient, install it with `pip install py-nobitex-api[async]`.")
+
+        super().__init__(
+            username=username,
+            password=password,
+            token=token,
+            api_url=api_url,
+            verbose=verbose,
+            timeout=timeout,
+            json_decoder=json_decoder,
+        )
+
+        self._connection_limit = connection_limit
+        self._keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    def enable_caching(self, *args, **kwargs) -> None:
+        """
+        Caching is based on requests_cache and is not available on the async client, use `enable_memory_cache`.
+        """
+        raise TypeError(f'enable_caching is not supported by {self.__class__.__name__}, use enable_memory_cache')
+
+    def _revalidate(self, memory_key: str, refresh: Callable[[], Any]) -> None:
+        """
+        Refresh a stale memory cache entry in a background task, unless its refresh is already running.
+        """
+        if not self._memory_cache.begin_refresh(memory_key):
+            return
+
+        cache = self._memory_cache
+        async def _run() -> None:
+            try:
+                await refresh()
+            except Exception:
+                # The stale entry keeps being served until its hard TTL, the next stale hit retries
+                pass
+            finally:
+                cache.end_refresh(memory_key)
+
+        # Keep a reference until done, the event loop only holds tasks weakly
+        task = asyncio.ensure_future(_run())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """
+        Return the shared session, creating it on the running event loop when needed.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared session and its connection pool.
+        """
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncNobitexClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _send_request(
+            self,
+            method: RequestMethod,
+            route: Optional[str] = '',
+            head_parms: Optional[dict] = None,
+            get_parms: Optional[dict] = None,
+            post_parms: Optional[dict] = None,
+            use_caching: Optional[bool] = None,
+            expire_after: Optional[timedelta | int] = None,
+            raw: bool = False,
+        ) -> dict | bytes:
+        """
+        Send a request to the Nobitex API and return the response data.
+
+        Args:
+            request_method (RequestMethod): The HTTP method for the request ('GET', 'POST', etc.).
+            route (str): The API route for the request.
+            head_parms (dict): The headers for the request.
+            get_parms (dict): The GET parameters for the request.
+            post_parms (dict): The POST parameters for the request.
+            use_caching (bool): Whether to use the memory cache for the request. Defaults to None (the route cache policy decides).
+            expire_after (timedelta | int): Expiration of the cached response. Defaults to None (route policy or cache default).
+            raw (bool): Return the undecoded response body of successful requests. Defaults to False.
+
+        Returns:
+            dict | bytes: json data from the response as a dict, or the response body in raw mode.
+
+        Raises:
+            NobitexException: If the server returns an error response.
+        """
+
+        request_kwargs = self._prepare_request(method, route, head_parms, get_parms, post_parms)
+        request_kwargs['method'] = request_kwargs['method'].upper()
+        request_kwargs['ssl'] = request_kwargs.pop('verify')
+        timeout = request_kwargs.pop('timeout')
+        if timeout is not None:
+            request_kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        use_caching, expire_after, stale_while_revalidate = self._resolve_caching(method, route, use_caching, expire_after)
+        store = None
+        if use_caching and self._memory_cache is not None:
+            memory_key = request_key(request_kwargs)
+            memory_cache = self._memory_cache
+            store = lambda status_code, content: memory_cache.set(
+                memory_key, status_code, content, expire_after, stale_while_revalidate,
+            )
+
+            cached = memory_cache.get(memory_key)
+            if cached is not None:
+                status_code, content, stale = cached
+                if stale:
+                    self._revalidate(memory_key, lambda: self._perform_request(method, route, request_kwargs, raw, store))
+                return self._parse_response(status_code, content, raw)
+
+        if self._single_flight is not None and method.upper() == 'GET':
+            return await self._single_flight.do_async(
+                request_key(request_kwargs, raw),
+                lambda: self._perform_request(method, route, request_kwargs, raw, store),
+            )
+        return await self._perform_request(method, route, request_kwargs, raw, store)
+
+    async def _perform_request(
+            self,
+            method: RequestMethod,
+            route: str,
+            request_kwargs: dict,
+            raw: bool = False,
+            store: Optional[Callable[[int, bytes], None]] = None,
+        ) -> dict | bytes:
+        """
+        Send a prepared request with rate limiting, retries and the circuit breaker, and parse the response.
+        `store` receives the status and body of successful responses.
+        """
+        policy = self._get_retry_policy(method, route)
+        breaker = self._get_circuit_breaker(request_kwargs['url'])
+        attempt = 0
+
+        while True:
+            if breaker:
+                breaker.before_request()
+
+            try:
+                if self._rate_limiter:
+                    await self._rate_limiter.acquire_async(route)
+                async with self._get_session().request(**request_kwargs) as response:
+                    content = await response.read()
+                    status = response.status
+                    retry_after = response.headers.get('Retry-After')
+                    url = response.url
+                    request_info, history, headers = response.request_info, response.history, response.headers
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if breaker:
+                    breaker.record_failure()
+                if policy is None or not policy.should_retry_error(attempt):
+                    raise
+                await asyncio.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+            except Exception:
+                # Any other failure to get a response (eg. ClientPayloadError) counts against the host
+                if breaker:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled by the caller (eg. wait_for), the host is not to blame but a half-open trial must be freed
+                if breaker:
+                    breaker.release()
+                raise
+
+            if breaker:
+                breaker.record(status)
+            if self._rate_limiter and status == 429:
+                self._rate_limiter.record_rejection(route)
+
+            if policy is not None and policy.should_retry_status(status, attempt):
+                await asyncio.sleep(policy.backoff(attempt, retry_after))
+                attempt += 1
+                continue
+
+            break
+
+        if self._verbose:
+            print(f'Sending Request: {method} - {url} - {status} - Cache: False')
+            print(content.decode(errors='replace'))
+
+        if store is not None and 200 <= status < 300:
+            store(status, content)
+
+        def _raise_for_status() -> None:
+            raise aiohttp.ClientResponseError(request_info, history, status=status, headers=headers)
+
+        return self._parse_response(status, content, raw, _raise_for_status)
+
+    def _chain(self, result: Any, callback: Callable[[dict], Any]) -> Any:
+        """
+        Apply `callback` on the awaited result of `_send_request`.
+
+        Args:
+            result (Awaitable[dict]): Coroutine returned by `_send_request`.
+            callback (Callable): Function applied on the response data.
+
+        Returns:
+            Awaitable: Coroutine resolving to the return value of the callback.
+        """
+        async def _await_then() -> Any:
+            return callback(await result)
+
+        return _await_then()
+
+
+    def _run_batch(
+            self,
+            calls: Dict[Hashable, Callable[[], Any]],
+            max_workers: int = 10,
+        ) -> Any:
+        """
+        Run independent calls concurrently on the event loop, at most `max_workers` at a time.
+        A failing call does not abort the batch, its exception is returned in place of the result.
+
+        Args:
+            calls (Dict[Hashable, Callable]): Zero-argument callables returning awaitables, keyed by an identifier.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 10.
+
+        Returns:
+            Awaitable[Dict[Hashable, Any]]: Result or raised exception of every call, keyed like `calls`.
+        """
+        async def _gather() -> Dict[Hashable, Any]:
+            semaphore = asyncio.Semaphore(max_workers)
+
+            async def _call(fn: Callable[[], Any]) -> Any:
+                async with semaphore:
+                    try:
+                        return await fn()
+                    except Exception as e:
+                        return e
+
+            results = await asyncio.gather(*(_call(fn) for fn in calls.values()))
+            return dict(zip(calls.keys(), results))
+
+        return _gather()
@@ -0,0 +1,132 @@
+# nobitex_api\_cache_index.py
+import heapq, threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+def timestamp(moment: Optional[datetime]) -> Optional[float]:
+    """
+    POSIX timestamp of a requests_cache datetime, naive datetimes are UTC.
+    """
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+class CacheIndex:
+    """
+    Creation and expiration time index of the persistent cache entries.
+    Entries are kept in two heaps, by creation and by expiration time, so removing the entries older than
+    a cutoff or expired at a time costs time proportional to the removed entries and never deserializes
+    a cached response.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, str]] = []
+        self._created: Dict[str, float] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expires: Dict[str, float] = {}
+        # Entries written before this index existed are only known after a scan of the backend
+        self.seeded = False
+
+    def _push(self, key: str, created: float, expires: Optional[float]) -> None:
+        self._created[key] = created
+        heapq.heappush(self._heap, (created, key))
+        if expires is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = expires
+            heapq.heappush(self._expiry_heap, (expires, key))
+
+    def add(self, key: str, created: float, expires: Optional[float] = None) -> None:
+        """
+        Record the write of a cache entry, a rewrite of the key replaces its times.
+        """
+        with self._lock:
+            self._push(key, created, expires)
+
+            # Frequently refreshed keys leave stale heap items behind, rebuild once they dominate
+            if len(self._heap) + len(self._expiry_heap) > 2 * (len(self._created) + len(self._expires)) + 1024:
+                self._heap = [(created, key) for key, created in self._created.items()]
+                heapq.heapify(self._heap)
+                self._expiry_heap = [(expires, key) for key, expires in self._expires.items()]
+                heapq.heapify(self._expiry_heap)
+
+    def seed(self, entries: Iterable[Tuple[str, float, Optional[float]]]) -> None:
+        """
+        Index entries written before this index existed, as (key, created, expires) tuples.
+        """
+        for key, created, expires in entries:
+            with self._lock:
+                if key not in self._created:
+                    self._push(key, created, expires)
+        self.seeded = True
+
+    def _forget(self, key: str) -> None:
+        self._created.pop(key, None)
+        self._expires.pop(key, None)
+
+    def pop_older(self, cutoff: float) -> List[str]:
+        """
+        Remove and return the keys of the entries created before `cutoff`.
+        """
+        keys: List[str] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < cutoff:
+                created, key = heapq.heappop(self._heap)
+                # Heap items of rewritten or removed keys are stale
+                if self._created.get(key) == created:
+                    self._forget(key)
+                    keys.append(key)
+        return keys
+
+    def pop_expired(self, now: float) -> List[str]:
+        """
+        Remove and return the keys of the entries expired at `now`.
+        """
+        keys: List[str] = []
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires, key = heapq.heappop(self._expiry_heap)
+                if self._expires.get(key) == expires:
+                    self._forget(key)
+                    keys.append(key)
+        return keys
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+            self._created.clear()
+            self._expiry_heap.clear()
+            self._expires.clear()
+
+    def __len__(self) -> int:
+        return len(self._created)
+
+class CacheEvictor:
+    """
+    Daemon thread calling `evict` every `interval` seconds until stopped.
+    """
+    def __init__(self, evict: Callable[[], None], interval: float) -> None:
+        self._evict = evict
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = threading.Thread(target=self._run, name='nobitex-cache-evictor', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self._evict()
+            except Exception:
+                # A failed pass is retried on the next interval
+                pass
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval)
+        self._thread = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(interval={self.interval}, running={self._thread is not None})'
@@ -0,0 +1,75 @@
+# nobitex_api\_cache_policy.py
+from datetime import timedelta
+from typing import Dict, Iterable, Optional
+
+class CachePolicy:
+    """
+    Whether and for how long the responses of a route are cached.
+
+    With stale_while_revalidate, the memory cache keeps serving an expired response for that long
+    while one background request refreshes it, so callers never wait on the network for it.
+    expire_after is then the soft TTL and expire_after + stale_while_revalidate the hard one.
+    """
+    def __init__(
+            self,
+            expire_after: timedelta | int,
+            methods: Iterable[str] = ('GET',),
+            stale_while_revalidate: Optional[timedelta | int] = None,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            expire_after (timedelta | int): Expiration of a cached response, int in seconds.
+            methods (Iterable[str], optional): HTTP methods whose responses are cached. Defaults to only GET.
+            stale_while_revalidate (timedelta | int, optional): How long an expired response is still served
+                by the memory cache while it is refreshed. Defaults to None.
+        """
+        self.expire_after = expire_after
+        self.methods = frozenset(method.upper() for method in methods)
+        self.stale_while_revalidate = stale_while_revalidate
+
+    def allows(self, method: str) -> bool:
+        return method.upper() in self.methods
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(expire_after={self.expire_after}, methods={sorted(self.methods)}, '
+            f'stale_while_revalidate={self.stale_while_revalidate})'
+        )
+
+# Policy by route prefix, the longest matching prefix wins and None never caches.
+# Routes without a matching prefix are not cached either, the explicit None entries
+# keep account data uncached when a shorter prefix is given a policy.
+DEFAULT_CACHE_POLICIES: Dict[str, Optional[CachePolicy]] = {
+    '/v2/options': CachePolicy(timedelta(hours=1), stale_while_revalidate=timedelta(hours=1)),
+    '/market/global-stats': CachePolicy(timedelta(minutes=5), methods=('POST',), stale_while_revalidate=timedelta(minutes=5)),
+    '/market/stats': CachePolicy(2, stale_while_revalidate=3),
+    '/v2/depth/': CachePolicy(1),
+    '/v3/orderbook/': CachePolicy(1),
+    '/market/orders/': None,
+    '/market/trades/': None,
+    '/users/': None,
+    '/wallets/': None,
+    '/v2/wallets': None,
+    '/auth/': None,
+    '/security/': None,
+    '/otp/': None,
+}
+
+def match_cache_policy(
+        policies: Dict[str, Optional[CachePolicy]],
+        method: str,
+        route: str,
+    ) -> Optional[CachePolicy]:
+    """
+    Cache policy of a request, None if its response must not be cached.
+    """
+    route = route if route.startswith('/') else f'/{route}'
+    policy = None
+    matched = ''
+    for prefix, route_policy in policies.items():
+        if route.startswith(prefix) and len(prefix) > len(matched):
+            matched, policy = prefix, route_policy
+
+    return policy if policy is not None and policy.allows(method) else None
@@ -0,0 +1,193 @@
+# nobitex_api\_candle_store.py
+import os, time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from ._arrays import CANDLE_COLUMNS, _require_numpy
+from ._currency import Currency
+from ._type_hints import CurrencyAgainstMode
+from .routes.market import _UDF_RESOLUTION_SECONDS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# On-disk dtype of each candle column
+_COLUMN_DTYPES: Dict[str, str] = {column: '<i8' if column == 't' else '<f8' for column in CANDLE_COLUMNS}
+
+class CandleStore:
+    """
+    Local columnar OHLCV store synced from udf/history.
+
+    Every (market, resolution) series is a directory holding one flat binary file per column
+    (t, o, h, l, c, v). Files are only appended to and are read through memory maps, so range
+    reads return zero-copy array views and startup does not depend on the size of the history.
+
+    Usage:
+        store = CandleStore('candles')
+        store.sync(client, CurrencyManager.btc, 'irt', '1', start=1704067200)
+        candles = store.read(CurrencyManager.btc, 'irt', '1', start=1719792000)
+        candles['c'].mean()
+    """
+    def __init__(self, directory: str | os.PathLike) -> None:
+        """
+        Initiation.
+
+        Args:
+            directory (str | PathLike): Root directory of the store, created when needed.
+        """
+        _require_numpy()
+        self._directory = Path(directory)
+        self._maps: Dict[str, Tuple[int, Dict[str, 'np.ndarray']]] = {}
+
+    def _series_path(self, currency: Currency, against: CurrencyAgainstMode, resolution: str) -> Path:
+        return self._directory / currency.get(against) / resolution
+
+    def _length(self, path: Path) -> int:
+        np = _require_numpy()
+        # A crash between column writes leaves longer columns behind, the shortest one is the truth
+        sizes = [
+            (path / column).stat().st_size // np.dtype(dtype).itemsize if (path / column).exists() else 0
+            for column, dtype in _COLUMN_DTYPES.items()
+        ]
+        return min(sizes)
+
+    def _columns(self, currency: Currency, against: CurrencyAgainstMode, resolution: str) -> Dict[str, 'np.ndarray']:
+        """
+        Memory mapped columns of a series, remapped only when the series grew.
+        """
+        np = _require_numpy()
+        path = self._series_path(currency, against, resolution)
+        length = self._length(path) if path.exists() else 0
+        key = str(path)
+
+        cached = self._maps.get(key)
+        if cached is not None and cached[0] == length:
+            return cached[1]
+
+        if length == 0:
+            columns = {column: np.empty(0, dtype=dtype) for column, dtype in _COLUMN_DTYPES.items()}
+        else:
+            columns = {
+                column: np.memmap(path / column, dtype=dtype, mode='r', shape=(length,))
+                for column, dtype in _COLUMN_DTYPES.items()
+            }
+        self._maps[key] = (length, columns)
+        return columns
+
+    def last_timestamp(self, currency: Currency, against: CurrencyAgainstMode, resolution: str) -> Optional[int]:
+        """
+        Timestamp of the last stored bar, None if the series is empty.
+        """
+        t = self._columns(currency, against, resolution)['t']
+        return int(t[-1]) if len(t) else None
+
+    def append(
+            self,
+            currency: Currency,
+            against: CurrencyAgainstMode,
+            resolution: str,
+            chunk: Dict[str, 'np.ndarray'],
+        ) -> int:
+        """
+        Append candles to a series, bars not newer than the last stored one are dropped.
+
+        Args:
+            currency (Currency): Currency of the market.
+            against (CurrencyAgainstMode): Quote currency of the market.
+            resolution (str): udf resolution of the series.
+            chunk (Dict[str, np.ndarray]): Candle columns, as yielded by `Market.iter_udf_history(output='array')`.
+
+        Returns:
+            int: Number of appended bars.
+        """
+        np = _require_numpy()
+        path = self._series_path(currency, against, resolution)
+        length = self._length(path) if path.exists() else 0
+        last = self.last_timestamp(currency, against, resolution)
+
+        t = np.asarray(chunk['t'], dtype=np.int64)
+        keep = slice(None) if last is None else t > last
+        added = len(t[keep])
+        if not added:
+            return 0
+
+        path.mkdir(parents=True, exist_ok=True)
+        for column, dtype in _COLUMN_DTYPES.items():
+            data = np.ascontiguousarray(np.asarray(chunk[column])[keep], dtype=dtype)
+            with open(path / column, 'r+b' if (path / column).exists() else 'wb') as file:
+                # Drop bytes left behind by an interrupted append before writing
+                file.truncate(length * data.itemsize)
+                file.seek(0, os.SEEK_END)
+                file.write(data.tobytes())
+
+        return added
+
+    def sync(
+            self,
+            client,
+            currency: Currency,
+            against: CurrencyAgainstMode,
+            resolution: str,
+            start: int,
+            end: Optional[int] = None,
+            bars_per_request: int = 500,
+        ) -> int:
+        """
+        Download the bars after the last stored one, or from `start` for a new series.
+        Bars that are still forming are not stored, they are picked up by the next sync.
+
+        Args:
+            client (NobitexClient): Client used for `Market.iter_udf_history`.
+            currency (Currency): Currency of the market.
+            against (CurrencyAgainstMode): Quote currency of the market.
+            resolution (str): udf resolution of the series.
+            start (int): From timestamp of a new series.
+            end (int, optional): To timestamp. Defaults to now.
+            bars_per_request (int, optional): Number of bars requested per window. Defaults to 500.
+
+        Returns:
+            int: Number of appended bars.
+        """
+        bar_seconds = _UDF_RESOLUTION_SECONDS[resolution]
+        last = self.last_timestamp(currency, against, resolution)
+        start = start if last is None else max(start, last + bar_seconds)
+        closed_before = int(time.time()) - bar_seconds
+        end = closed_before if end is None else min(end, closed_before)
+        if start > end:
+            return 0
+
+        added = 0
+        for chunk in client.Market.iter_udf_history(currency, against, resolution, start, end, bars_per_request, output='array'):
+            added += self.append(currency, against, resolution, chunk)
+        return added
+
+    def read(
+            self,
+            currency: Currency,
+            against: CurrencyAgainstMode,
+            resolution: str,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+        ) -> Dict[str, 'np.ndarray']:
+        """
+        Read the bars with start <= t <= end as read-only views over the memory mapped files.
+
+        Args:
+            currency (Currency): Currency of the market.
+            against (CurrencyAgainstMode): Quote currency of the market.
+            resolution (str): udf resolution of the series.
+            start (int, optional): From timestamp. Defaults to the first bar.
+            end (int, optional): To timestamp. Defaults to the last bar.
+
+        Returns:
+            Dict[str, np.ndarray]: Candle columns keyed by 't', 'o', 'h', 'l', 'c' and 'v'.
+        """
+        np = _require_numpy()
+        columns = self._columns(currency, against, resolution)
+        t = columns['t']
+        first = 0 if start is None else int(np.searchsorted(t, start, side='left'))
+        last = len(t) if end is None else int(np.searchsorted(t, end, side='right'))
+        return {column: values[first:last] for column, values in columns.items()}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self._directory)!r})'
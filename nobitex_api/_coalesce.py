@@ -0,0 +1,121 @@
+# nobitex_api\_coalesce.py
+import json, threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional
+
+if TYPE_CHECKING:
+    import asyncio
+
+def request_key(request_kwargs: dict, raw: bool = False) -> str:
+    """
+    Identity of a prepared request: method, url, params, body and the Authorization header.
+    """
+    return json.dumps(
+        [
+            request_kwargs['method'].upper(),
+            request_kwargs['url'],
+            request_kwargs.get('params') or {},
+            request_kwargs.get('json') or {},
+            (request_kwargs.get('headers') or {}).get('Authorization'),
+            raw,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """
+    Shares one execution between identical calls made while the first one is in flight.
+    The first caller of a key runs the call, callers arriving before it finishes wait for its result
+    or exception. Nothing is kept once the call finished, this is not a cache.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._flights: Dict[Hashable, list] = {}  # key -> [task, waiting callers]
+        self.hits = 0
+        self.misses = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn`, or wait for the in-flight call of the same key and return its result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn()`, or wait for the in-flight call of the same key and return its result.
+        The call runs in its own task: a cancelled caller, the first one included, stops waiting
+        without cancelling it for the others. It is cancelled when its last caller is.
+        """
+        # Only loaded by the async client, asyncio is not needed to import the package
+        import asyncio
+
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(fn())
+            flight = self._flights[key] = [task, 0]
+            self.misses += 1
+
+            def _done(task: 'asyncio.Task') -> None:
+                if self._flights.get(key, [None])[0] is task:
+                    del self._flights[key]
+                # Mark the exception as retrieved when every caller was cancelled
+                task.cancelled() or task.exception()
+            task.add_done_callback(_done)
+        else:
+            self.hits += 1
+
+        task = flight[0]
+        flight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if flight[1] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            flight[1] -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the shared calls.
+
+        Returns:
+            dict: hits (calls served by an in-flight call), misses (calls executed) and in_flight.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'in_flight': len(self._calls) + len(self._flights)}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(hits={self.hits}, misses={self.misses})'
@@ -1,10 +1,12 @@
 # nobitex_api\_currency.py
-from typing import Literal
+from typing import Dict, Literal, Tuple
 
 class Currency:
     """
     Base Class for Currency.
     """
+    __slots__ = ('name', 'irt', 'usdt', 'symbol')
+
     def __init__(
             self,
             name: str,
@@ -17,8 +19,8 @@ class Currency:
         
         Args:
             name (str): Name of the currency.
-            upper (str): Upper case name of the currency.
-            lower (str): Lower case name of the currency.
+            irt (str): Market symbol against IRT (eg. 'BTCIRT').
+            usdt (str): Market symbol against USDT (eg. 'BTCUSDT').
             symbol (str): Symbol of the currency.
         """
         self.name = name
@@ -26,26 +28,31 @@ class Currency:
         self.usdt = usdt
         self.symbol = symbol
 
-        self._dict = {
-            "name": name,
-            "irt": irt,
-            "usdt": usdt,
-            "symbol": symbol,
-        }
-
-    def get(self, currency: Literal['irt', 'usdt', 'symbol']) -> str:
-        result = self._dict[currency]
+    def get(self, currency: Literal['name', 'irt', 'usdt', 'symbol']) -> str:
+        if currency not in self.__slots__:
+            raise KeyError(currency)
+        result = getattr(self, currency)
         if result: return result
         else: raise ValueError(f"Invalid currency: {currency}")
 
     def __str__(self) -> str:
         return self.name
 
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.name})'
+
 class CurrencyManager:
     """
     Class to manage currencies.
+
+    Currencies are looked up by symbol with `by_symbol` and market strings of responses
+    ('BTCIRT', 'btc-rls', 'ETHUSDT') are parsed with `parse_market`, both through dicts built at import.
     """
 
+    # Filled by _build_indexes once the class is defined
+    _by_symbol: Dict[str, Currency] = {}
+    _markets: Dict[str, Tuple[Currency, Literal['irt', 'usdt']]] = {}
+
     all = Currency('all', 'all', 'all', 'all')
     rial = Currency('rial', 'RLS', 'RLS', 'rls')
 
@@ -141,3 +148,55 @@ class CurrencyManager:
     yfi = Currency('yfi', 'YFIIRT', 'YFIUSDT', 'yfi')
     zro = Currency('zro', 'ZROIRT', 'ZROUSDT', 'zro')
     zrx = Currency('zrx', 'ZRXIRT', 'ZRXUSDT', 'zrx')
+
+    @classmethod
+    def currencies(cls) -> Tuple[Currency, ...]:
+        """
+        Every traded currency, without the 'all' placeholder and the rial quote currency.
+        """
+        return tuple(currency for currency in cls._by_symbol.values() if currency is not cls.all and currency is not cls.rial)
+
+    @classmethod
+    def by_symbol(cls, symbol: str) -> Currency:
+        """
+        Currency of a symbol (eg. 'btc', 'BTC' or 'rls').
+
+        Raises:
+            ValueError: If the symbol is unknown.
+        """
+        currency = cls._by_symbol.get(symbol) or cls._by_symbol.get(symbol.lower())
+        if currency is None:
+            raise ValueError(f"Unknown currency: {symbol}")
+        return currency
+
+    @classmethod
+    def parse_market(cls, market: str) -> Tuple[Currency, Literal['irt', 'usdt']]:
+        """
+        Currency and quote of a market string, as found in response keys.
+        Accepts pair symbols ('BTCIRT', 'ETHUSDT') and dashed markets ('btc-rls', 'BTC-USDT', 'btc-irt').
+
+        Raises:
+            ValueError: If the market is unknown.
+        """
+        parsed = cls._markets.get(market) or cls._markets.get(market.lower()) or cls._markets.get(market.upper())
+        if parsed is None:
+            raise ValueError(f"Unknown market: {market}")
+        return parsed
+
+def _build_indexes() -> None:
+    currencies = [value for value in vars(CurrencyManager).values() if isinstance(value, Currency)]
+
+    CurrencyManager._by_symbol = {currency.symbol: currency for currency in currencies}
+
+    markets: Dict[str, Tuple[Currency, Literal['irt', 'usdt']]] = {}
+    for currency in currencies:
+        if currency is CurrencyManager.all or currency is CurrencyManager.rial:
+            continue
+        markets[currency.irt] = (currency, 'irt')
+        markets[currency.usdt] = (currency, 'usdt')
+        markets[f'{currency.symbol}-rls'] = (currency, 'irt')
+        markets[f'{currency.symbol}-irt'] = (currency, 'irt')
+        markets[f'{currency.symbol}-usdt'] = (currency, 'usdt')
+    CurrencyManager._markets = markets
+
+_build_indexes()
@@ -2,4 +2,9 @@
 class NobitexException(Exception):
     '''
     Nobitex Server Exception
-    '''
\ No newline at end of file
+    '''
+
+class CircuitOpenError(NobitexException):
+    '''
+    Raised without sending the request while the circuit breaker of the host is open
+    '''
@@ -0,0 +1,176 @@
+# nobitex_api\_memory_cache.py
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from time import monotonic
+from typing import Dict, Optional, Set, Tuple
+
+def ttl_seconds(expire_after: Optional[timedelta | int | float]) -> Optional[float]:
+    """
+    Expiration of a cache entry in seconds, None for an expire_after of None.
+    """
+    if expire_after is None:
+        return None
+    if isinstance(expire_after, timedelta):
+        return expire_after.total_seconds()
+    return float(expire_after)
+
+class MemoryCache:
+    """
+    Bounded in-process cache of response bodies with a TTL per entry and LRU eviction.
+    Bodies are kept undecoded, every hit is decoded again so callers never share a mutable result.
+
+    An entry stored with a stale_while_revalidate window is served as stale during that window after
+    its TTL, the caller refreshes it in the background. `begin_refresh` lets only one refresh of a key run.
+    """
+    def __init__(
+            self,
+            expire_after: timedelta | int | float = 5,
+            max_entries: int = 1024,
+            max_bytes: int = 32 * 1024 * 1024,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            expire_after (timedelta | int | float, optional): Default TTL of an entry in seconds. Defaults to 5.
+            max_entries (int, optional): Maximum number of entries. Defaults to 1024.
+            max_bytes (int, optional): Maximum total size of the stored bodies. Defaults to 32 MiB.
+        """
+        self.expire_after = ttl_seconds(expire_after)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> (fresh_until, expires_at, status_code, content), least recently used first
+        self._entries: 'OrderedDict[str, Tuple[float, float, int, bytes]]' = OrderedDict()
+        self._bytes = 0
+        self._refreshing: Set[str] = set()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes, bool]]:
+        """
+        (status_code, content, stale) of an entry, None on a miss.
+        """
+        now = monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            stale = entry[0] <= now
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            return entry[2], entry[3], stale
+
+    def set(
+            self,
+            key: str,
+            status_code: int,
+            content: bytes,
+            expire_after: Optional[timedelta | int | float] = None,
+            stale_while_revalidate: Optional[timedelta | int | float] = None,
+            age: float = 0.0,
+            expires_in: Optional[float] = None,
+        ) -> None:
+        """
+        Store a response body, evicting the least recently used entries to stay within the caps.
+
+        Args:
+            key (str): Identity of the request.
+            status_code (int): HTTP status of the response.
+            content (bytes): Response body.
+            expire_after (timedelta | int | float, optional): TTL of the entry. Defaults to the cache TTL.
+            stale_while_revalidate (timedelta | int | float, optional): Seconds the entry is served as stale after its TTL.
+                Defaults to None.
+            age (float, optional): Seconds the response has already lived, eg. in a persistent cache. The TTL and
+                the stale window count from the creation of the response. Defaults to 0.
+            expires_in (float, optional): Remaining lifetime of the persistent copy, the entry is not fresh for
+                longer. Defaults to None.
+        """
+        ttl = ttl_seconds(expire_after)
+        ttl = self.expire_after if ttl is None else ttl
+        if ttl is not None and expires_in is not None:
+            ttl = min(ttl, age + expires_in)
+        stale = ttl_seconds(stale_while_revalidate) or 0.0
+        size = len(content)
+        if ttl is None or ttl + stale <= age or size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and (len(self._entries) >= self.max_entries or self._bytes + size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+            now = monotonic() - age
+            self._entries[key] = (now + ttl, now + ttl + stale, status_code, content)
+            self._bytes += size
+
+    def begin_refresh(self, key: str) -> bool:
+        """
+        Claim the background refresh of a stale entry, False if a refresh of the key is already running.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.refreshes += 1
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= len(self._entries.pop(key)[3])
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters of the cache.
+
+        Returns:
+            dict: hits, stale_hits, refreshes, misses, hit_rate, evictions, expirations, entries and bytes.
+        """
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'refreshes': self.refreshes,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(entries={len(self._entries)}, bytes={self._bytes}, hits={self.hits}, misses={self.misses})'
@@ -1,4 +1,6 @@
 # nobitex_api\_mixins.py
+from typing import Generic, Type, TypeVar, overload
+
 from .routes import (
     Auth,
     Depth,
@@ -11,16 +13,40 @@ from .routes import (
     Users,
     Wallets,
 )
+from .routes._base import NobitexRoute
+
+Route = TypeVar('Route', bound=NobitexRoute)
+
+class _LazyRoute(Generic[Route]):
+    """
+    Creates the route object of a client on first access.
+    The object is stored in the client __dict__ under the same name, later
+    lookups find it there and never reach this descriptor again.
+    """
+    def __init__(self, route: Type[Route]) -> None:
+        self._route = route
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> '_LazyRoute[Route]': ...
+    @overload
+    def __get__(self, instance: object, owner: type) -> Route: ...
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.setdefault(self._name, self._route(instance))
 
 class RouteMixin:
-    def __init__(self) -> None:
-        self.Auth = Auth(self)
-        self.Depth = Depth(self)
-        self.Market = Market(self)
-        self.Options = Options(self)
-        self.Orderbook = Orderbook(self)
-        self.OTP = OTP(self)
-        self.Security = Security(self)
-        self.Trades = Trades(self)
-        self.Users = Users(self)
-        self.Wallets = Wallets(self)
\ No newline at end of file
+    Auth = _LazyRoute(Auth)
+    Depth = _LazyRoute(Depth)
+    Market = _LazyRoute(Market)
+    Options = _LazyRoute(Options)
+    Orderbook = _LazyRoute(Orderbook)
+    OTP = _LazyRoute(OTP)
+    Security = _LazyRoute(Security)
+    Trades = _LazyRoute(Trades)
+    Users = _LazyRoute(Users)
+    Wallets = _LazyRoute(Wallets)
@@ -0,0 +1,231 @@
+# nobitex_api\_models.py
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, overload
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    return float(value)
+
+class _Number:
+    """
+    Descriptor exposing the raw string slot `_<name>` as a float, converted on access.
+    """
+    __slots__ = ('_slot',)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = f'_{name}'
+
+    def __get__(self, instance, owner: type):
+        if instance is None:
+            return self
+        return _to_float(getattr(instance, self._slot))
+
+class PriceLevels(Sequence):
+    """
+    Read-only view over the [price, volume] string pairs of a response.
+    Rows are converted to (price, volume) floats only when they are read, nothing is copied.
+    """
+    __slots__ = ('_raw',)
+
+    def __init__(self, raw: List[List[str]]) -> None:
+        self._raw = raw
+
+    @overload
+    def __getitem__(self, index: int) -> Tuple[float, float]: ...
+    @overload
+    def __getitem__(self, index: slice) -> 'PriceLevels': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PriceLevels(self._raw[index])
+        price, volume = self._raw[index][:2]
+        return float(price), float(volume)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        for price, volume, *_ in self._raw:
+            yield float(price), float(volume)
+
+    @property
+    def best(self) -> Optional[Tuple[float, float]]:
+        return self[0] if self._raw else None
+
+    def prices(self) -> List[float]:
+        return [float(level[0]) for level in self._raw]
+
+    def volumes(self) -> List[float]:
+        return [float(level[1]) for level in self._raw]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(levels={len(self)}, best={self.best})'
+
+class BookSnapshot:
+    """
+    Orderbook or depth snapshot, returned by `Orderbook.get_orders` and `Depth.get_depth` with output='model'.
+    """
+    __slots__ = ('bids', 'asks', 'last_update', '_last_trade_price')
+
+    last_trade_price = _Number()
+
+    def __init__(
+            self,
+            bids: PriceLevels,
+            asks: PriceLevels,
+            last_update: Optional[int] = None,
+            last_trade_price: Optional[str] = None,
+        ) -> None:
+        self.bids = bids
+        self.asks = asks
+        self.last_update = last_update
+        self._last_trade_price = last_trade_price
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'BookSnapshot':
+        return cls(
+            bids=PriceLevels(data.get('bids', [])),
+            asks=PriceLevels(data.get('asks', [])),
+            last_update=data.get('lastUpdate'),
+            last_trade_price=data.get('lastTradePrice'),
+        )
+
+    @property
+    def spread(self) -> Optional[float]:
+        if not (self.bids and self.asks):
+            return None
+        return self.asks[0][0] - self.bids[0][0]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(bids={len(self.bids)}, asks={len(self.asks)}, last_update={self.last_update})'
+
+class Trade:
+    """
+    Public trade, returned in a list by `Trades.get_trades` with output='model'.
+    """
+    __slots__ = ('time', '_price', '_volume', 'type')
+
+    price = _Number()
+    volume = _Number()
+
+    def __init__(self, time: int, price: str, volume: str, type: str) -> None:
+        self.time = time
+        self._price = price
+        self._volume = volume
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Trade':
+        return cls(data.get('time'), data.get('price'), data.get('volume'), data.get('type'))
+
+    @classmethod
+    def from_response(cls, data: dict) -> List['Trade']:
+        return [cls(trade.get('time'), trade.get('price'), trade.get('volume'), trade.get('type')) for trade in data.get('trades', [])]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(time={self.time}, price={self._price}, volume={self._volume}, type={self.type})'
+
+class MarketStats:
+    """
+    Stats of one market, returned in a dict keyed by market (eg. 'btc-rls') by `Market.get_stats` with output='model'.
+    """
+    __slots__ = (
+        'is_closed', '_best_sell', '_best_buy', '_volume_src', '_volume_dst', '_latest',
+        '_mark', '_day_low', '_day_high', '_day_open', '_day_close', '_day_change',
+    )
+
+    best_sell = _Number()
+    best_buy = _Number()
+    volume_src = _Number()
+    volume_dst = _Number()
+    latest = _Number()
+    mark = _Number()
+    day_low = _Number()
+    day_high = _Number()
+    day_open = _Number()
+    day_close = _Number()
+    day_change = _Number()
+
+    # Response key of each slot
+    _FIELDS: Tuple[Tuple[str, str], ...] = (
+        ('_best_sell', 'bestSell'),
+        ('_best_buy', 'bestBuy'),
+        ('_volume_src', 'volumeSrc'),
+        ('_volume_dst', 'volumeDst'),
+        ('_latest', 'latest'),
+        ('_mark', 'mark'),
+        ('_day_low', 'dayLow'),
+        ('_day_high', 'dayHigh'),
+        ('_day_open', 'dayOpen'),
+        ('_day_close', 'dayClose'),
+        ('_day_change', 'dayChange'),
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MarketStats':
+        stats = cls.__new__(cls)
+        stats.is_closed = data.get('isClosed')
+        for slot, key in cls._FIELDS:
+            setattr(stats, slot, data.get(key))
+        return stats
+
+    @classmethod
+    def from_response(cls, data: dict) -> Dict[str, 'MarketStats']:
+        return {market: cls.from_dict(stats) for market, stats in data.get('stats', {}).items()}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(latest={self._latest}, best_buy={self._best_buy}, best_sell={self._best_sell})'
+
+class Order:
+    """
+    User order, returned in a list by `Market.get_orders_list` with output='model'.
+    """
+    __slots__ = (
+        'id', 'client_order_id', 'type', 'execution', 'trade_type', 'market', 'status', 'partial', 'created_at',
+        'src_currency', 'dst_currency', '_price', '_amount', '_matched_amount', '_unmatched_amount',
+        '_average_price', '_total_price', '_fee',
+    )
+
+    price = _Number()
+    amount = _Number()
+    matched_amount = _Number()
+    unmatched_amount = _Number()
+    average_price = _Number()
+    total_price = _Number()
+    fee = _Number()
+
+    # Response key of each slot
+    _FIELDS: Tuple[Tuple[str, str], ...] = (
+        ('id', 'id'),
+        ('client_order_id', 'clientOrderId'),
+        ('type', 'type'),
+        ('execution', 'execution'),
+        ('trade_type', 'tradeType'),
+        ('market', 'market'),
+        ('status', 'status'),
+        ('partial', 'partial'),
+        ('created_at', 'created_at'),
+        ('src_currency', 'srcCurrency'),
+        ('dst_currency', 'dstCurrency'),
+        ('_price', 'price'),
+        ('_amount', 'amount'),
+        ('_matched_amount', 'matchedAmount'),
+        ('_unmatched_amount', 'unmatchedAmount'),
+        ('_average_price', 'averagePrice'),
+        ('_total_price', 'totalPrice'),
+        ('_fee', 'fee'),
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Order':
+        order = cls.__new__(cls)
+        for slot, key in cls._FIELDS:
+            setattr(order, slot, data.get(key))
+        return order
+
+    @classmethod
+    def from_response(cls, data: dict) -> List['Order']:
+        return [cls.from_dict(order) for order in data.get('orders', [])]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(id={self.id}, {self.type} {self._amount} @ {self._price}, status={self.status})'
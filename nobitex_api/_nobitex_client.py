@@ -1,15 +1,33 @@
 # nobitex_api\_nobitex_client.py
-import json, requests_cache
+import json, time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from concurrent.futures import ThreadPoolExecutor
 from requests import Response, Session
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from urllib.parse import urlsplit
 
-from typing import Optional, Literal
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Literal, Tuple
+from datetime import datetime, timedelta, timezone
 
 from ._mixins import RouteMixin
 from ._url import NobitexAPI
+from ._cache_policy import CachePolicy, DEFAULT_CACHE_POLICIES, match_cache_policy
+from ._cache_index import CacheEvictor, CacheIndex, timestamp
+from ._coalesce import SingleFlight, request_key
 from ._exceptions import NobitexException
+from ._memory_cache import MemoryCache
+from ._rate_limit import RateLimiter
+from ._retry import CircuitBreaker, RetryPolicy
 from ._type_hints import RequestMethod
 
+if TYPE_CHECKING:
+    import requests_cache
+
 class NobitexClient(RouteMixin):
     """
     NobitexClient provides methods for interacting with the Nobitex API. 
@@ -22,6 +40,8 @@ class NobitexClient(RouteMixin):
                 token: Optional[str] = '',
                 api_url: str = NobitexAPI,
                 verbose: bool = False,
+                timeout: Optional[float] = None,
+                json_decoder: Optional[Callable[[bytes], Any]] = None,
             ) -> None:
         """
         Initialize the NobitexClient.
@@ -31,6 +51,9 @@ class NobitexClient(RouteMixin):
             password (str): The password for authentication.
             api_url (str): URL of the Nobitex API, if you dont use the cloud version specify the local server.
             verbose (bool): Prints the response from the API. Defaults to False. Not Recommended
+            timeout (float): Seconds to wait for the server before giving up on a request. Defaults to None (wait forever).
+            json_decoder (Callable[[bytes], Any]): Parses response bodies straight from bytes. Defaults to orjson.loads
+                if orjson is installed, otherwise json.loads.
         """
 
         if not ((username and password) or token):
@@ -41,6 +64,8 @@ class NobitexClient(RouteMixin):
         self._token = token
         self._api_url = api_url
         self._verbose = verbose
+        self._timeout = timeout
+        self._json_decoder: Callable[[bytes], Any] = json_decoder or (orjson.loads if orjson else json.loads)
         self._device: str = ''
 
         # Default session (non-cached)
@@ -48,8 +73,26 @@ class NobitexClient(RouteMixin):
 
         # Cache settings
         self._caching = False
-        self._cached_session: Optional[requests_cache.CachedSession] = None
+        self._cached_session: Optional['requests_cache.CachedSession'] = None
+        self._cache_backend: Optional[str] = None
         self._expire_after: Optional[timedelta | int] = None
+        self._memory_cache: Optional[MemoryCache] = None
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._cache_policies: Dict[str, Optional[CachePolicy]] = dict(DEFAULT_CACHE_POLICIES)
+        self._cache_index = CacheIndex()
+        self._cache_evictor: Optional[CacheEvictor] = None
+
+        # Rate limit settings
+        self._rate_limiter: Optional[RateLimiter] = None
+
+        # Retry settings
+        self._retry_policy: Optional[RetryPolicy] = None
+        self._route_retry_policies: Dict[str, Optional[RetryPolicy]] = {}
+        self._circuit_breaker_settings: Optional[Tuple[int, float]] = None
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+        # Coalescing settings
+        self._single_flight: Optional[SingleFlight] = None
 
         super().__init__()
 
@@ -71,8 +114,12 @@ class NobitexClient(RouteMixin):
             connection: URI string for Redis or MongoDB.
             backend_options: Extra args passed to backend (like `use_cache_dir=False`)
         """
+        # Imported here, loading requests_cache and its backends is the largest part of the import time
+        import requests_cache
 
         self._expire_after = expire_after
+        # Policies may approve POST routes such as global-stats, they only reach this session when they do
+        backend_options.setdefault('allowable_methods', ('GET', 'HEAD', 'POST'))
 
         if backend == "sqlite":
             self._cached_session = requests_cache.CachedSession(
@@ -109,12 +156,124 @@ class NobitexClient(RouteMixin):
                 expire_after=expire_after,
                 **backend_options,
             )
+            # Entries are removed by the server through a TTL index on their creation time
+            if expire_after is not None:
+                self._cached_session.cache.set_ttl(expire_after)
 
         else:
             raise ValueError(f"Unsupported backend: {backend}")
 
+        self._cache_backend = backend
+        self._cache_index = CacheIndex()
         self._caching = True
 
+    def set_cache_policies(
+        self,
+        policies: Dict[str, Optional[CachePolicy | timedelta | int]],
+        replace: bool = False,
+    ) -> None:
+        """
+        Override the cache policies consulted by every route.
+        By default option and global stats responses are kept for long, market stats, depth and orderbook
+        for a second or two, and order, wallet and account routes are never cached.
+
+        Args:
+            policies: Policies by route prefix (eg. '/market/stats'), a timedelta or int is a GET policy with that
+                expiration and None disables caching of the route. The longest matching prefix wins.
+            replace: Replace the default policies instead of merging over them. Defaults to False
+        """
+        policies = {
+            (route if route.startswith('/') else f'/{route}'):
+                policy if policy is None or isinstance(policy, CachePolicy) else CachePolicy(policy)
+            for route, policy in policies.items()
+        }
+        self._cache_policies = policies if replace else {**self._cache_policies, **policies}
+
+    def get_cache_policy(self, method: RequestMethod, route: str) -> Optional[CachePolicy]:
+        """
+        Cache policy of a request, None if its response is not cached.
+        """
+        return match_cache_policy(self._cache_policies, method, route)
+
+    def _resolve_caching(
+            self,
+            method: RequestMethod,
+            route: str,
+            use_caching: Optional[bool],
+            expire_after: Optional[timedelta | int],
+        ) -> Tuple[bool, Optional[timedelta | int], Optional[timedelta | int]]:
+        """
+        Whether a request is cached, its expiration and its stale_while_revalidate window.
+        The route policy decides when use_caching is None.
+        """
+        if use_caching is False:
+            return False, None, None
+
+        policy = self.get_cache_policy(method, route)
+        if policy is None:
+            return use_caching is True, expire_after, None
+        if expire_after is None:
+            expire_after = policy.expire_after
+        return True, expire_after, policy.stale_while_revalidate
+
+    def _revalidate(self, memory_key: str, refresh: Callable[[], Any]) -> None:
+        """
+        Refresh a stale memory cache entry on the background worker, unless its refresh is already running.
+        """
+        if not self._memory_cache.begin_refresh(memory_key):
+            return
+
+        cache = self._memory_cache
+        def _run() -> None:
+            try:
+                refresh()
+            except Exception:
+                # The stale entry keeps being served until its hard TTL, the next stale hit retries
+                pass
+            finally:
+                cache.end_refresh(memory_key)
+
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='nobitex-revalidate')
+        self._refresh_executor.submit(_run)
+
+    def enable_memory_cache(
+        self,
+        expire_after: timedelta | int | float = 5,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        """
+        Enables the in-process cache tier, looked up before the persistent cache of `enable_caching`.
+        Only requests sent with caching are stored, an expire_after given to the request overrides the default TTL.
+        Routes whose cache policy has a stale_while_revalidate window are served stale within it and
+        refreshed by one background worker.
+
+        Args:
+            expire_after: Default TTL of an entry in seconds. Defaults to 5.
+            max_entries: Maximum number of entries, the least recently used is evicted first. Defaults to 1024.
+            max_bytes: Maximum total size of the stored response bodies. Defaults to 32 MiB.
+        """
+        self._memory_cache = MemoryCache(expire_after=expire_after, max_entries=max_entries, max_bytes=max_bytes)
+
+    def disable_memory_cache(self) -> None:
+        """
+        Disable the in-process cache tier and drop its entries.
+        """
+        self._memory_cache = None
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+            self._refresh_executor = None
+
+    def get_memory_cache_stats(self) -> Dict[str, float]:
+        """
+        Get counters of the in-process cache tier.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, expirations, entries and bytes. Empty if disabled.
+        """
+        return self._memory_cache.stats() if self._memory_cache else {}
+
     def disable_caching(self, clear_cache: bool = True) -> None:
         """
         Disable caching.
@@ -123,45 +282,233 @@ class NobitexClient(RouteMixin):
             clear_cache (bool, optional): Whether to clear the cache before disabling it. Defaults to True
         """
 
+        self.stop_cache_eviction()
         if self._cached_session and clear_cache:
             self._cached_session.cache.clear()
         self._cached_session = None
+        self._cache_index = CacheIndex()
         self._caching = False
 
     def clear_cache(self, time: Optional[timedelta | int] = None) -> None:
         """
         Clear the cache.
-        If time is provided, clear the cache for requests made within the specified time frame.
+        If time is provided, only remove the entries older than it.
+        Entries are found through a creation time index, the entries written before this client enabled
+        caching are indexed by a single scan of the backend on the first call.
 
         Args:
-            time (Optional[timedelta | int], optional): Time frame to clear the cache for.
+            time (Optional[timedelta | int], optional): Age of the oldest entry kept, int in seconds.
             Defaults to None.
         """
 
-        if not isinstance(self._cached_session, requests_cache.CachedSession):
+        if time is None and self._memory_cache is not None:
+            self._memory_cache.clear()
+
+        if self._cached_session is None:
             return
 
         backend = self._cached_session.cache
 
         if time is None:
             backend.clear()
+            self._cache_index.clear()
+            self._cache_index.seeded = True
             if self._verbose:
                 print("Cache cleared (all entries).")
         else:
             if isinstance(time, int):
                 time = timedelta(seconds=time)
 
-            cutoff = datetime.now() - time
-            removed = 0
-
-            for key, response in backend.responses.items():
-                created = response.created_at
-                if created and created < cutoff:
-                    backend.delete(key)
-                    removed += 1
+            self._seed_cache_index()
+            keys = self._cache_index.pop_older((datetime.now(timezone.utc) - time).timestamp())
+            if keys:
+                # Unlike responses.bulk_delete, also drops the redirects pointing to the deleted keys
+                backend.delete(*keys)
 
             if self._verbose:
-                print(f"Removed {removed} expired cache entries.")
+                print(f"Removed {len(keys)} expired cache entries.")
+
+    def _seed_cache_index(self) -> None:
+        """
+        Index the entries written before this client enabled caching, with a single scan of the backend.
+        """
+        if self._cache_index.seeded:
+            return
+        self._cache_index.seed(
+            (key, response.created_at.timestamp(), timestamp(response.expires))
+            for key, response in self._cached_session.cache.responses.items()
+            if response.created_at
+        )
+
+    def remove_expired_cache(self, max_age: Optional[timedelta | int] = None) -> None:
+        """
+        Remove the expired entries of the persistent cache, and the entries older than `max_age` if given.
+        The sqlite backend deletes expired entries with one query on its expiration index, redis and mongodb
+        expire entries on the server, and the other backends delete the expired keys of the cache index
+        without reading the stored responses.
+
+        Args:
+            max_age (Optional[timedelta | int], optional): Age of the oldest entry kept, int in seconds. Defaults to None.
+        """
+        if self._cached_session is None:
+            return
+
+        backend = self._cached_session.cache
+        now = time.time()
+        if self._cache_backend == 'sqlite':
+            # Vacuuming rewrites the whole database, skip it on periodic passes
+            backend.delete(expired=True, vacuum=False)
+            self._cache_index.pop_expired(now)
+        elif self._cache_backend in ('redis', 'mongodb'):
+            # Already gone or about to be, only forget them
+            self._cache_index.pop_expired(now)
+        else:
+            self._seed_cache_index()
+            keys = self._cache_index.pop_expired(now)
+            if keys:
+                backend.delete(*keys)
+
+        if max_age is not None:
+            self.clear_cache(max_age)
+
+    def start_cache_eviction(self, interval: float = 60, max_age: Optional[timedelta | int] = None) -> None:
+        """
+        Run `remove_expired_cache` on a background thread every `interval` seconds.
+
+        Args:
+            interval (float, optional): Seconds between two passes. Defaults to 60.
+            max_age (Optional[timedelta | int], optional): Also remove the entries older than this. Defaults to None.
+        """
+        self.stop_cache_eviction()
+        self._cache_evictor = CacheEvictor(lambda: self.remove_expired_cache(max_age), interval)
+
+    def stop_cache_eviction(self) -> None:
+        """
+        Stop the background cache eviction thread.
+        """
+        if self._cache_evictor is not None:
+            self._cache_evictor.stop()
+            self._cache_evictor = None
+
+    def enable_rate_limit(
+        self,
+        limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        global_limit: Optional[Tuple[int, float]] = None,
+    ) -> None:
+        """
+        Enables client side rate limiting.
+        Requests wait for a token of their route family ('market_data', 'orders', 'wallets', 'auth', 'default'),
+        order placement and cancellation are served before other waiting requests.
+
+        Args:
+            limits: (calls, period in seconds) per route family, merged over the defaults.
+            global_limit: (calls, period in seconds) shared by every request. Defaults to None
+        """
+        self._rate_limiter = RateLimiter(limits=limits, global_limit=global_limit)
+
+    def disable_rate_limit(self) -> None:
+        """
+        Disable client side rate limiting.
+        """
+        self._rate_limiter = None
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get rate limiter counters per route family.
+
+        Returns:
+            dict: requests, throttled, rejected, queued_time and max_queued_time per family. Empty if disabled.
+        """
+        return self._rate_limiter.stats() if self._rate_limiter else {}
+
+    def enable_retries(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        route_policies: Optional[Dict[str, Optional[RetryPolicy]]] = None,
+        circuit_breaker: bool = True,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        """
+        Enables retries of transient failures and the per-host circuit breaker.
+
+        Args:
+            policy: Default retry policy. Defaults to RetryPolicy(), which only retries GET requests.
+            route_policies: Policies by route prefix (eg. '/market/global-stats'), None disables retries of the route.
+                The longest matching prefix wins.
+            circuit_breaker: Whether to fail fast while the host is degraded. Defaults to True
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_timeout: Seconds the circuit stays open before a trial request.
+        """
+        self._retry_policy = policy or RetryPolicy()
+        self._route_retry_policies = {
+            (route if route.startswith('/') else f'/{route}'): route_policy
+            for route, route_policy in (route_policies or {}).items()
+        }
+        self._circuit_breaker_settings = (failure_threshold, recovery_timeout) if circuit_breaker else None
+        self._circuit_breakers = {}
+
+    def disable_retries(self) -> None:
+        """
+        Disable retries and the circuit breaker.
+        """
+        self._retry_policy = None
+        self._route_retry_policies = {}
+        self._circuit_breaker_settings = None
+        self._circuit_breakers = {}
+
+    def enable_coalescing(self) -> None:
+        """
+        Enables coalescing of identical GET requests.
+        A GET sent while the same request (method, url, params, body and token) is in flight
+        waits for it and receives its result instead of calling the server again.
+        Waiters share the returned object, treat it as read-only.
+        """
+        self._single_flight = SingleFlight()
+
+    def disable_coalescing(self) -> None:
+        """
+        Disable coalescing of identical GET requests.
+        """
+        self._single_flight = None
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """
+        Get request coalescing counters.
+
+        Returns:
+            dict: hits (requests served by an in-flight request), misses (requests sent) and in_flight. Empty if disabled.
+        """
+        return self._single_flight.stats() if self._single_flight else {}
+
+    def _get_retry_policy(self, method: RequestMethod, route: str) -> Optional[RetryPolicy]:
+        """
+        Retry policy of a request, None if it must not be retried.
+        """
+        if self._retry_policy is None:
+            return None
+
+        route = route if route.startswith('/') else f'/{route}'
+        policy = self._retry_policy
+        matched = ''
+        for prefix, route_policy in self._route_retry_policies.items():
+            if route.startswith(prefix) and len(prefix) > len(matched):
+                matched, policy = prefix, route_policy
+
+        return policy if policy is not None and policy.allows(method) else None
+
+    def _get_circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """
+        Circuit breaker of the request host, None if disabled.
+        """
+        if self._circuit_breaker_settings is None:
+            return None
+
+        host = urlsplit(url).netloc
+        breaker = self._circuit_breakers.get(host)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(host, CircuitBreaker(*self._circuit_breaker_settings))
+        return breaker
 
     def _send_request(
             self, 
@@ -170,9 +517,10 @@ class NobitexClient(RouteMixin):
             head_parms: Optional[dict] = None,
             get_parms: Optional[dict] = None,
             post_parms: Optional[dict] = None,
-            use_caching: Optional[bool] = False,
+            use_caching: Optional[bool] = None,
             expire_after: Optional[timedelta | int] = None,
-        ) -> dict:
+            raw: bool = False,
+        ) -> dict | bytes:
         """
         Send a request to the Nobitex API and return the response data.
 
@@ -182,16 +530,182 @@ class NobitexClient(RouteMixin):
             head_parms (dict): The headers for the request.
             get_parms (dict): The GET parameters for the request.
             post_parms (dict): The POST parameters for the request.
-            use_caching (bool): Whether to use caching for the request. Defaults to False.
-            expire_after (timedelta | int): Time frame to clear the cache for. Defaults to None
+            use_caching (bool): Whether to use caching for the request. Defaults to None (the route cache policy decides).
+            expire_after (timedelta | int): Expiration of the cached response. Defaults to None (route policy or cache default).
+            raw (bool): Return the undecoded response body of successful requests. Defaults to False.
+
+        Returns:
+            dict | bytes: json data from the response as a dict, or the response body in raw mode.
+
+        Raises:
+            NobitexException: If the server returns an error response.
+        """
+
+        request_kwargs = self._prepare_request(method, route, head_parms, get_parms, post_parms)
+        use_caching, expire_after, stale_while_revalidate = self._resolve_caching(method, route, use_caching, expire_after)
+        session = self._cached_session if (self._caching and use_caching) else self._normal_session
+        if session is self._cached_session and expire_after:
+            request_kwargs['expire_after'] = expire_after
+
+        store = None
+        if use_caching and self._memory_cache is not None:
+            memory_key = request_key(request_kwargs)
+            memory_cache = self._memory_cache
+            store = lambda status_code, content, age=0.0, expires_in=None: memory_cache.set(
+                memory_key, status_code, content, expire_after, stale_while_revalidate, age, expires_in,
+            )
+
+            cached = memory_cache.get(memory_key)
+            if cached is not None:
+                status_code, content, stale = cached
+                if stale:
+                    self._revalidate(memory_key, lambda: self._perform_request(method, route, request_kwargs, raw, store, session))
+                return self._parse_response(status_code, content, raw)
+
+        if self._single_flight is not None and method.upper() == 'GET':
+            return self._single_flight.do(
+                request_key(request_kwargs, raw),
+                lambda: self._perform_request(method, route, request_kwargs, raw, store, session),
+            )
+        return self._perform_request(method, route, request_kwargs, raw, store, session)
+
+    def _perform_request(
+            self,
+            method: RequestMethod,
+            route: str,
+            request_kwargs: dict,
+            raw: bool = False,
+            store: Optional[Callable[[int, bytes, float, Optional[float]], None]] = None,
+            session: Optional[Session] = None,
+        ) -> dict | bytes:
+        """
+        Send a prepared request with rate limiting, retries and the circuit breaker, and parse the response.
+        `store` receives the status, body, age and remaining cache lifetime in seconds of successful responses.
+        """
+        session = session or self._normal_session
+        policy = self._get_retry_policy(method, route)
+        breaker = self._get_circuit_breaker(request_kwargs['url'])
+        attempt = 0
+
+        while True:
+            if breaker:
+                breaker.before_request()
+
+            try:
+                if self._rate_limiter:
+                    self._rate_limiter.acquire(route)
+                response: Response = session.request(**request_kwargs)
+            except (RequestsConnectionError, Timeout):
+                if breaker:
+                    breaker.record_failure()
+                if policy is None or not policy.should_retry_error(attempt):
+                    raise
+                time.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+            except Exception:
+                # Any other failure to get a response (eg. ChunkedEncodingError) counts against the host
+                if breaker:
+                    breaker.record_failure()
+                raise
+            except BaseException:
+                # Interrupted by the caller, the host is not to blame but a half-open trial must be freed
+                if breaker:
+                    breaker.release()
+                raise
+
+            if breaker:
+                breaker.record(response.status_code)
+            if self._rate_limiter and response.status_code == 429:
+                self._rate_limiter.record_rejection(route)
+
+            if policy is not None and policy.should_retry_status(response.status_code, attempt):
+                time.sleep(policy.backoff(attempt, response.headers.get('Retry-After')))
+                attempt += 1
+                continue
+
+            break
+
+        if self._verbose:
+            from_cache = getattr(response, 'from_cache', False)
+            print(f'Sending Request: {method} - {response.url} - {response.status_code} - Cache: {from_cache}')
+            print(response.text)
+
+        cache_key = getattr(response, 'cache_key', None)
+        if cache_key and not getattr(response, 'from_cache', False):
+            self._cache_index.add(cache_key, time.time(), timestamp(getattr(response, 'expires', None)))
+
+        if store is not None and 200 <= response.status_code < 300:
+            # A persistent cache hit has already lived part of its TTL
+            now = time.time()
+            age = 0.0
+            if getattr(response, 'from_cache', False) and response.created_at:
+                age = max(now - timestamp(response.created_at), 0.0)
+            expires = timestamp(getattr(response, 'expires', None))
+            store(response.status_code, response.content, age, None if expires is None else expires - now)
+
+        return self._parse_response(response.status_code, response.content, raw, response.raise_for_status)
+
+    def _parse_response(
+            self,
+            status_code: int,
+            content: bytes,
+            raw: bool = False,
+            raise_for_status: Optional[Callable[[], None]] = None,
+        ) -> dict | bytes:
+        """
+        Decode a response body and raise on error responses, shared by the sync and async clients.
+
+        Args:
+            status_code (int): HTTP status of the response.
+            content (bytes): Response body.
+            raw (bool): Return `content` as is for successful responses. Defaults to False.
+            raise_for_status (Callable): Raises the http error of server side errors.
 
         Returns:
-            dict: json data from the response as a dict.
+            dict | bytes: json data from the response as a dict, or the response body in raw mode.
 
         Raises:
             NobitexException: If the server returns an error response.
         """
 
+        # Raise on server side http error
+        if status_code >= 500 and raise_for_status is not None:
+            raise_for_status()
+
+        if raw and 200 <= status_code < 300:
+            return content
+
+        response_dict: dict = self._json_decoder(content)
+
+        # Initiate server response
+        if not 200 <= status_code < 300:
+            raise NobitexException(f"Code: {status_code} --> Response:{response_dict}")
+
+        return response_dict
+
+    def _prepare_request(
+            self,
+            method: RequestMethod,
+            route: Optional[str] = '',
+            head_parms: Optional[dict] = None,
+            get_parms: Optional[dict] = None,
+            post_parms: Optional[dict] = None,
+        ) -> dict:
+        """
+        Build the keyword arguments of a request, shared by the sync and async clients.
+
+        Args:
+            method (RequestMethod): The HTTP method for the request ('GET', 'POST', etc.).
+            route (str): The API route for the request.
+            head_parms (dict): The headers for the request.
+            get_parms (dict): The GET parameters for the request.
+            post_parms (dict): The POST parameters for the request.
+
+        Returns:
+            dict: method, url, headers, params and json of the request.
+        """
+
         head_parms = head_parms or {}
         get_parms = get_parms or {}
         post_parms = post_parms or {}
@@ -202,41 +716,60 @@ class NobitexClient(RouteMixin):
             head_parms['Authorization'] = f'Token {self._token}'
 
         route = f'/{route}' if route and not route.startswith('/') else route
-        url = self._api_url + route
-        session = self._cached_session if (self._caching and use_caching) else self._normal_session
 
-        request_kwargs = {
+        return {
             'method': method,
-            'url': url,
+            'url': self._api_url + route,
             'headers': head_parms,
             'params': get_parms,
             'json': post_parms,
             'verify': True,
+            'timeout': self._timeout,
         }
-        if use_caching and expire_after:
-            request_kwargs['expire_after'] = expire_after
 
-        response: Response = session.request(**request_kwargs)
-
-        if self._verbose:
-            from_cache = getattr(response, 'from_cache', False)
-            print(f'Sending Request: {method} - {response.url} - {response.status_code} - Cache: {from_cache}')
-            print(response.text)
+    def _chain(self, result: dict, callback: Callable[[dict], Any]) -> Any:
+        """
+        Apply `callback` on the result of `_send_request`.
+        Routes use this to post-process responses, so the same route code works on the async client.
 
-        # Check for Server respond
-        if 200 <= response.status_code < 500:
-            response_dict: dict = json.loads(response.text)
+        Args:
+            result (dict): Value returned by `_send_request`.
+            callback (Callable): Function applied on the response data.
 
-        else:
-            # Raise on server side http error
-            response.raise_for_status()
+        Returns:
+            Any: Return value of the callback.
+        """
+        return callback(result)
 
-        # Initiate server response
-        if not 200 <= response.status_code < 300:
-            raise NobitexException(f"Code: {response.status_code} --> Response:{response_dict}")
+    def _run_batch(
+            self,
+            calls: Dict[Hashable, Callable[[], Any]],
+            max_workers: int = 10,
+        ) -> Dict[Hashable, Any]:
+        """
+        Run independent calls concurrently on a bounded thread pool over the shared session.
+        A failing call does not abort the batch, its exception is returned in place of the result.
 
-        return response_dict
+        Args:
+            calls (Dict[Hashable, Callable]): Zero-argument callables keyed by an identifier.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 10, the
+                connection pool size of a requests session.
 
+        Returns:
+            Dict[Hashable, Any]: Result or raised exception of every call, keyed like `calls`.
+        """
+        if not calls:
+            return {}
+
+        def _call(fn: Callable[[], Any]) -> Any:
+            try:
+                return fn()
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = {key: executor.submit(_call, fn) for key, fn in calls.items()}
+            return {key: future.result() for key, future in futures.items()}
 
     def __repr__(self):
         return f'{self.__class__.__name__}(username={self._username}, ***)'
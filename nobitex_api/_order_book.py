@@ -0,0 +1,214 @@
+# nobitex_api\_order_book.py
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ._currency import Currency
+from ._type_hints import CurrencyAgainstMode
+
+class OrderBookSide:
+    """
+    One side of an order book, kept as sorted parallel price/volume arrays.
+
+    Levels are stored with the best price at the end of the arrays, so the best level is read
+    in O(1) and the frequent changes near the top of the book move as little memory as possible.
+    """
+    __slots__ = ('_is_bid', '_keys', '_prices', '_volumes', '_levels', '_cumulative')
+
+    def __init__(self, is_bid: bool) -> None:
+        """
+        Initiation.
+
+        Args:
+            is_bid (bool): True for the bids side (best = highest price), False for asks (best = lowest price).
+        """
+        self._is_bid = is_bid
+        self._keys: List[float] = []            # Ascending sort keys, price for bids and -price for asks
+        self._prices: List[float] = []
+        self._volumes: List[float] = []
+        self._levels: Dict[float, float] = {}   # price -> volume
+        self._cumulative: Optional[List[float]] = None
+
+    def _key(self, price: float) -> float:
+        return price if self._is_bid else -price
+
+    def apply(self, levels: List[List[str]]) -> int:
+        """
+        Replace the side with a snapshot, touching only the levels that changed.
+
+        Args:
+            levels (List[List[str]]): [price, volume] pairs as returned by the API.
+
+        Returns:
+            int: Number of changed price levels.
+        """
+        new_levels = {float(price): float(volume) for price, volume, *_ in levels}
+        changed = 0
+
+        for price in [price for price in self._levels if price not in new_levels]:
+            self._remove(price)
+            changed += 1
+
+        current = self._levels
+        for price, volume in new_levels.items():
+            if current.get(price) != volume:
+                self._set(price, volume)
+                changed += 1
+
+        if changed:
+            self._cumulative = None
+        return changed
+
+    def _set(self, price: float, volume: float) -> None:
+        key = self._key(price)
+        index = bisect_left(self._keys, key)
+        if price in self._levels:
+            self._volumes[index] = volume
+        else:
+            self._keys.insert(index, key)
+            self._prices.insert(index, price)
+            self._volumes.insert(index, volume)
+        self._levels[price] = volume
+
+    def _remove(self, price: float) -> None:
+        index = bisect_left(self._keys, self._key(price))
+        del self._keys[index]
+        del self._prices[index]
+        del self._volumes[index]
+        del self._levels[price]
+
+    @property
+    def best(self) -> Optional[Tuple[float, float]]:
+        """
+        Best (price, volume) level, or None if the side is empty.
+        """
+        if not self._prices:
+            return None
+        return self._prices[-1], self._volumes[-1]
+
+    def volume_at(self, price: float) -> float:
+        """
+        Volume resting at an exact price level, 0 if there is no such level.
+        """
+        return self._levels.get(price, 0.0)
+
+    def rank(self, price: float) -> int:
+        """
+        Number of levels priced strictly better than `price`, in O(log n).
+        """
+        return len(self._keys) - bisect_right(self._keys, self._key(price))
+
+    def _get_cumulative(self) -> List[float]:
+        # Cumulative volume from the best level outward, rebuilt lazily after a change
+        if self._cumulative is None:
+            self._cumulative = list(accumulate(reversed(self._volumes)))
+        return self._cumulative
+
+    def cumulative_volume(self, price: float) -> float:
+        """
+        Total volume of the levels priced at or better than `price`.
+        """
+        count = len(self._keys) - bisect_left(self._keys, self._key(price))
+        return self._get_cumulative()[count - 1] if count else 0.0
+
+    def depth(self, levels: int) -> float:
+        """
+        Total volume of the best `levels` price levels.
+        """
+        levels = min(levels, len(self._prices))
+        return self._get_cumulative()[levels - 1] if levels > 0 else 0.0
+
+    def price_for_volume(self, volume: float) -> Optional[float]:
+        """
+        Worst price reached when taking `volume` from this side, None if the side is too thin.
+        """
+        cumulative = self._get_cumulative()
+        index = bisect_left(cumulative, volume)
+        if index >= len(cumulative):
+            return None
+        return self._prices[-1 - index]
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        """
+        Iterate (price, volume) levels from the best price outward.
+        """
+        return zip(reversed(self._prices), reversed(self._volumes))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({"bids" if self._is_bid else "asks"}, levels={len(self)})'
+
+class OrderBook:
+    """
+    Locally maintained L2 order book fed by successive `/v3/orderbook` snapshots.
+
+    Usage:
+        book = OrderBook(CurrencyManager.btc, 'irt')
+        client.Orderbook.sync_book(book)
+        book.spread, book.bids.cumulative_volume(price)
+    """
+    def __init__(
+            self,
+            currency: Optional[Currency] = None,
+            against: CurrencyAgainstMode = 'irt',
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            currency (Currency, optional): Currency of the market, used by `Orderbook.sync_book`.
+            against (CurrencyAgainstMode, optional): Quote currency of the market. Defaults to 'irt'.
+        """
+        self.currency = currency
+        self.against = against
+        self.bids = OrderBookSide(is_bid=True)
+        self.asks = OrderBookSide(is_bid=False)
+        self.last_update: Optional[int] = None
+        self.last_trade_price: Optional[str] = None
+
+    def update(self, data: dict) -> int:
+        """
+        Apply an orderbook snapshot. Snapshots older than the current state are ignored.
+
+        Args:
+            data (dict): Response of `Orderbook.get_orders`.
+
+        Returns:
+            int: Number of changed price levels.
+        """
+        last_update = data.get('lastUpdate')
+        if last_update is not None and self.last_update is not None and last_update <= self.last_update:
+            return 0
+
+        changed = self.bids.apply(data.get('bids', [])) + self.asks.apply(data.get('asks', []))
+        self.last_update = last_update
+        self.last_trade_price = data.get('lastTradePrice', self.last_trade_price)
+        return changed
+
+    @property
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        return self.bids.best
+
+    @property
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        return self.asks.best
+
+    @property
+    def spread(self) -> Optional[float]:
+        """
+        Best ask minus best bid, None if a side is empty.
+        """
+        if not (self.bids._prices and self.asks._prices):
+            return None
+        return self.asks._prices[-1] - self.bids._prices[-1]
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        if not (self.bids._prices and self.asks._prices):
+            return None
+        return (self.asks._prices[-1] + self.bids._prices[-1]) / 2
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.currency}, {self.against}, bids={len(self.bids)}, asks={len(self.asks)})'
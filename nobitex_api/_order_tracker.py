@@ -0,0 +1,217 @@
+# nobitex_api\_order_tracker.py
+import inspect
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ._currency import Currency, CurrencyManager
+
+# Final statuses of an order, every other status is open
+_CLOSED_STATUSES = frozenset(('done', 'canceled'))
+
+class OrderEvent(NamedTuple):
+    """
+    Change of a tracked order found by `OrderTracker.poll`.
+    kind is 'fill' (filled is the newly matched amount) or 'cancel'.
+    """
+    kind: str
+    order: dict
+    filled: Decimal = Decimal(0)
+
+def _matched(order: dict) -> Decimal:
+    return Decimal(order.get('matchedAmount') or 0)
+
+def _is_open(order: dict) -> bool:
+    return str(order.get('status', '')).lower() not in _CLOSED_STATUSES
+
+def _market_of(order: dict) -> Optional[Tuple[Currency, Currency]]:
+    """
+    (src_currency, dst_currency) of an order from its market (eg. 'BTC-RLS'), None if unknown.
+    """
+    try:
+        currency, against = CurrencyManager.parse_market(order.get('market') or '')
+    except ValueError:
+        return None
+    return currency, CurrencyManager.rial if against == 'irt' else CurrencyManager.usdt
+
+class OrderTracker:
+    """
+    Keeps the state of our own orders in memory, indexed by id and clientOrderId.
+
+    `poll` sends one `Market.get_orders_list` call per market with open tracked orders, filtered on
+    open orders from the lowest tracked open id (the fromId watermark). Only the tracked orders missing
+    from that list, which were filled or canceled since the last poll, are fetched one by one.
+
+    Usage:
+        tracker = OrderTracker(client, on_fill=print)
+        tracker.track_many(client.Market.add_orders(specs).values())
+        tracker.poll()
+    """
+    def __init__(
+            self,
+            client,
+            on_fill: Optional[Callable[[OrderEvent], None]] = None,
+            on_cancel: Optional[Callable[[OrderEvent], None]] = None,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            client (NobitexClient): Client used for the Market calls.
+            on_fill (Callable, optional): Called with the fill events of every poll.
+            on_cancel (Callable, optional): Called with the cancel events of every poll.
+        """
+        if inspect.iscoroutinefunction(client._send_request):
+            raise TypeError(f'OrderTracker is not supported by {client.__class__.__name__}')
+
+        self._client = client
+        self._on_fill = on_fill
+        self._on_cancel = on_cancel
+
+        self._by_id: Dict[int, dict] = {}
+        self._by_client_order_id: Dict[str, dict] = {}
+        self._open: Dict[int, dict] = {}
+
+        self.polls = 0
+        self.calls = 0
+        self.calls_saved = 0
+
+    def track(self, order: dict) -> Optional[dict]:
+        """
+        Start tracking an order.
+
+        Args:
+            order (dict): Order dict, or a response of `Market.add_order` or `Market.get_order_status`.
+                Exceptions returned by `Market.add_orders` are ignored.
+
+        Returns:
+            dict: The tracked order, None if nothing was tracked.
+        """
+        if isinstance(order, Exception):
+            return None
+        order = order.get('order', order)
+        if order.get('id') is None:
+            return None
+
+        self._by_id[order['id']] = order
+        if order.get('clientOrderId'):
+            self._by_client_order_id[order['clientOrderId']] = order
+        if _is_open(order):
+            self._open[order['id']] = order
+        else:
+            self._open.pop(order['id'], None)
+        return order
+
+    def track_many(self, orders: Iterable[dict]) -> None:
+        for order in orders:
+            self.track(order)
+
+    def get(self, id: Optional[int] = None, client_order_id: Optional[str] = None) -> Optional[dict]:
+        """
+        Tracked order by id or clientOrderId.
+        """
+        if id is not None:
+            return self._by_id.get(id)
+        return self._by_client_order_id.get(client_order_id)
+
+    @property
+    def open_orders(self) -> List[dict]:
+        return list(self._open.values())
+
+    def _update(self, order: dict, events: List[OrderEvent]) -> None:
+        """
+        Replace a tracked order with its new state and record its events.
+        """
+        previous = self._by_id.get(order['id'])
+        filled = _matched(order) - (_matched(previous) if previous else Decimal(0))
+        if filled > 0:
+            events.append(OrderEvent('fill', order, filled))
+        if str(order.get('status', '')).lower() == 'canceled' and (previous is None or _is_open(previous)):
+            events.append(OrderEvent('cancel', order))
+        self.track(order)
+
+    def _markets(self) -> Dict[Tuple[Currency, Currency], int]:
+        """
+        fromId watermark of every market with open tracked orders.
+        """
+        watermarks: Dict[Tuple[Currency, Currency], int] = {}
+        for order in self._open.values():
+            market = _market_of(order)
+            if market is not None:
+                watermarks[market] = min(order['id'], watermarks.get(market, order['id']))
+        return watermarks
+
+    def poll(self, max_workers: int = 10) -> List[OrderEvent]:
+        """
+        Refresh the open tracked orders and return their fill and cancel events.
+
+        Args:
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 10.
+
+        Returns:
+            List[OrderEvent]: Events in the order they were found.
+        """
+        self.polls += 1
+        open_before = len(self._open)
+        watermarks = self._markets()
+
+        calls = {
+            market: (lambda market=market, from_id=from_id: self._client.Market.get_orders_list(
+                src_currency=market[0], dst_currency=market[1], details=2,
+                from_id=from_id, order='id', execution=None, status='open',
+            ))
+            for market, from_id in watermarks.items()
+        }
+        results = self._client._run_batch(calls, max_workers=max_workers)
+        calls_made = len(calls)
+
+        events: List[OrderEvent] = []
+        listed = set()
+        for market, result in results.items():
+            if isinstance(result, Exception):
+                # Orders of this market are checked again on the next poll
+                listed.update(id for id, order in self._open.items() if _market_of(order) == market)
+                continue
+            for order in result.get('orders', []):
+                if order.get('id') in self._by_id:
+                    listed.add(order['id'])
+                    self._update(order, events)
+
+        # Tracked orders that left the open list were filled or canceled, orders of unknown markets are always checked
+        missing = [id for id in self._open if id not in listed]
+        statuses = self._client._run_batch(
+            {id: (lambda id=id: self._client.Market.get_order_status(id)) for id in missing},
+            max_workers=max_workers,
+        )
+        calls_made += len(missing)
+        for id, result in statuses.items():
+            if isinstance(result, Exception) or 'order' not in result:
+                continue
+            self._update(result['order'], events)
+
+        self.calls += calls_made
+        # One get_order_status per open order is what polling without the tracker costs
+        self.calls_saved += max(0, open_before - calls_made)
+
+        for event in events:
+            callback = self._on_fill if event.kind == 'fill' else self._on_cancel
+            if callback is not None:
+                callback(event)
+        return events
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the tracker.
+
+        Returns:
+            dict: tracked, open, polls, calls and calls_saved.
+        """
+        return {
+            'tracked': len(self._by_id),
+            'open': len(self._open),
+            'polls': self.polls,
+            'calls': self.calls,
+            'calls_saved': self.calls_saved,
+        }
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(tracked={len(self._by_id)}, open={len(self._open)})'
@@ -0,0 +1,82 @@
+# nobitex_api\_pagination.py
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generic, Iterator, Optional, Tuple, TypeVar
+
+Page = TypeVar('Page')
+
+class PrefetchIterator(Generic[Page]):
+    """
+    Iterates pages of a paginated route while the next page is fetched on a background thread.
+
+    `fetch(cursor)` returns `(page, next_cursor, has_next)`, a has_next of False ends the iteration.
+    Only the page being consumed and the one being fetched are alive at any time.
+    `cursor` is the cursor of the page after the last one returned, save it to resume later. It stays
+    valid once the iteration is `exhausted`, resuming from it returns the items added since.
+    Use it as a context manager to stop prefetching when leaving the loop early, an iterator dropped
+    before the end releases its thread when it is garbage collected.
+    """
+    def __init__(
+            self,
+            fetch: Callable[[Any], Tuple[Optional[Page], Any, bool]],
+            cursor: Any,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            fetch (Callable): Fetches the page at a cursor and returns (page, next_cursor, has_next).
+            cursor (Any): Cursor of the first page.
+        """
+        self._fetch = fetch
+        self.cursor = cursor
+        self.exhausted = False
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1)
+        self._future: Optional[Future] = self._executor.submit(self._fetch, cursor)
+        # Holds no reference to the iterator, so a dropped iterator is still collected
+        self._finalizer = weakref.finalize(self, self._executor.shutdown, wait=False, cancel_futures=True)
+
+    def __iter__(self) -> Iterator[Page]:
+        return self
+
+    def __next__(self) -> Page:
+        while self._future is not None:
+            try:
+                page, next_cursor, has_next = self._future.result()
+            except BaseException:
+                self.close()
+                raise
+
+            if not has_next:
+                self._future = None
+                self.exhausted = True
+            else:
+                # Request the next page before handing this one to the caller
+                self._future = self._executor.submit(self._fetch, next_cursor)
+            self.cursor = next_cursor
+
+            if page:
+                return page
+
+        self.close()
+        raise StopIteration
+
+    def close(self) -> None:
+        """
+        Stop prefetching and release the background thread.
+        """
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        if self._executor is not None:
+            self._finalizer()
+            self._executor = None
+
+    def __enter__(self) -> 'PrefetchIterator[Page]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(cursor={self.cursor}, exhausted={self.exhausted})'
@@ -0,0 +1,195 @@
+# nobitex_api\_portfolio.py
+import inspect, math, threading, time
+from typing import Dict, List, Literal, Optional
+
+from ._arrays import _require_numpy
+from ._currency import Currency, CurrencyManager
+
+class Portfolio:
+    """
+    Wallet balances valued in IRT and USDT.
+
+    A refresh costs two requests whatever the number of currencies: one `Wallets.get_wallet` call for
+    every balance and one multi-market `Market.get_stats` call for the prices of the held currencies.
+    Valuation is one vectorized pass over the balance and price arrays. Currencies without an rls
+    market are priced through their usdt market and the usdt-rls rate, and the other way round.
+    IRT values use the rls market prices as returned by the API (rials).
+
+    Usage:
+        portfolio = Portfolio(client)
+        portfolio.refresh()
+        portfolio.total_irt, portfolio.positions()
+        portfolio.start(interval=5, balance_interval=60)
+    """
+    def __init__(self, client, wallet_type: Literal['spot', 'margin'] = 'spot') -> None:
+        """
+        Initiation.
+
+        Args:
+            client (NobitexClient): Client used for the Wallets and Market calls.
+            wallet_type (Literal['spot', 'margin'], optional): Wallet to value. Defaults to 'spot'.
+        """
+        np = _require_numpy()
+        if inspect.iscoroutinefunction(client._send_request):
+            raise TypeError(f'Portfolio is not supported by {client.__class__.__name__}')
+
+        self._client = client
+        self.wallet_type = wallet_type
+
+        self._lock = threading.Lock()
+        self.symbols: List[str] = []
+        self.balances = np.empty(0, dtype=np.float64)
+        self.blocked = np.empty(0, dtype=np.float64)
+        self.prices_irt = np.empty(0, dtype=np.float64)
+        self.prices_usdt = np.empty(0, dtype=np.float64)
+        self.values_irt = np.empty(0, dtype=np.float64)
+        self.values_usdt = np.empty(0, dtype=np.float64)
+        self._stats: Dict[str, dict] = {}
+
+        self.balances_updated_at: Optional[float] = None
+        self.prices_updated_at: Optional[float] = None
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh_balances(self) -> None:
+        """
+        Reload every balance with one `Wallets.get_wallet` call, then revalue.
+        """
+        np = _require_numpy()
+        wallets = self._client.Wallets.get_wallet(self.wallet_type).get('wallets', {})
+        symbols = [symbol.lower() for symbol in wallets]
+        balances = np.array([float(wallet.get('balance') or 0) for wallet in wallets.values()], dtype=np.float64)
+        blocked = np.array([float(wallet.get('blocked') or 0) for wallet in wallets.values()], dtype=np.float64)
+
+        with self._lock:
+            self.symbols, self.balances, self.blocked = symbols, balances, blocked
+            self.balances_updated_at = time.time()
+            self._value()
+
+    def refresh_prices(self) -> None:
+        """
+        Reload the prices of the held currencies with one `Market.get_stats` call, then revalue.
+        """
+        with self._lock:
+            symbols, balances = self.symbols, self.balances
+
+        held: List[Currency] = [CurrencyManager.usdt]
+        for symbol, balance in zip(symbols, balances):
+            if balance and symbol not in ('rls', 'usdt'):
+                try:
+                    held.append(CurrencyManager.by_symbol(symbol))
+                except ValueError:
+                    continue
+
+        stats = self._client.Market.get_stats(held, [CurrencyManager.rial, CurrencyManager.usdt]).get('stats', {})
+        with self._lock:
+            self._stats = stats
+            self.prices_updated_at = time.time()
+            self._value()
+
+    def refresh(self) -> None:
+        """
+        Reload balances, then the prices of the held currencies.
+        """
+        self.refresh_balances()
+        self.refresh_prices()
+
+    def _latest(self, market: str) -> float:
+        stats = self._stats.get(market)
+        latest = stats.get('latest') if stats else None
+        return float(latest) if latest else math.nan
+
+    def _value(self) -> None:
+        """
+        Price and value every position, called with the lock held.
+        """
+        np = _require_numpy()
+        symbols = np.array(self.symbols, dtype=object)
+        usdt_irt = self._latest('usdt-rls')
+
+        prices_irt = np.array([self._latest(f'{symbol}-rls') for symbol in self.symbols], dtype=np.float64)
+        prices_usdt = np.array([self._latest(f'{symbol}-usdt') for symbol in self.symbols], dtype=np.float64)
+        prices_irt[symbols == 'rls'] = 1.0
+        prices_usdt[symbols == 'usdt'] = 1.0
+
+        # Cross through the usdt-rls rate where one of the two markets is missing
+        prices_irt = np.where(np.isnan(prices_irt), prices_usdt * usdt_irt, prices_irt)
+        prices_usdt = np.where(np.isnan(prices_usdt), prices_irt / usdt_irt, prices_usdt)
+
+        self.prices_irt, self.prices_usdt = prices_irt, prices_usdt
+        self.values_irt = self.balances * prices_irt
+        self.values_usdt = self.balances * prices_usdt
+
+    @property
+    def total_irt(self) -> float:
+        """
+        Value of the priced positions in IRT.
+        """
+        return float(_require_numpy().nansum(self.values_irt))
+
+    @property
+    def total_usdt(self) -> float:
+        """
+        Value of the priced positions in USDT.
+        """
+        return float(_require_numpy().nansum(self.values_usdt))
+
+    def positions(self, include_empty: bool = False) -> List[dict]:
+        """
+        Positions sorted by IRT value, largest first. Unpriced positions have NaN prices and values.
+
+        Args:
+            include_empty (bool, optional): Include zero balances. Defaults to False.
+        """
+        np = _require_numpy()
+        with self._lock:
+            order = np.argsort(-np.nan_to_num(self.values_irt, nan=-np.inf), kind='stable')
+            return [
+                {
+                    'currency': self.symbols[i],
+                    'balance': float(self.balances[i]),
+                    'blocked': float(self.blocked[i]),
+                    'price_irt': float(self.prices_irt[i]),
+                    'price_usdt': float(self.prices_usdt[i]),
+                    'value_irt': float(self.values_irt[i]),
+                    'value_usdt': float(self.values_usdt[i]),
+                }
+                for i in order
+                if include_empty or self.balances[i]
+            ]
+
+    def start(self, interval: float = 5, balance_interval: float = 60) -> None:
+        """
+        Refresh in a background thread: prices every `interval` seconds, balances every `balance_interval` seconds.
+        Failed refreshes keep the previous values and are retried on the next interval.
+        """
+        self.stop()
+        self._stopped.clear()
+
+        def _run() -> None:
+            next_balances = 0.0
+            while not self._stopped.is_set():
+                try:
+                    if time.monotonic() >= next_balances:
+                        self.refresh_balances()
+                        next_balances = time.monotonic() + balance_interval
+                    self.refresh_prices()
+                except Exception:
+                    pass
+                self._stopped.wait(interval)
+
+        self._thread = threading.Thread(target=_run, name='nobitex-portfolio', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background refresh.
+        """
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.wallet_type}, positions={int(_require_numpy().count_nonzero(self.balances))}, total_irt={self.total_irt:.0f})'
@@ -0,0 +1,259 @@
+# nobitex_api\_rate_limit.py
+import threading
+from bisect import insort
+from itertools import count
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+PRIORITY_HIGH: int = 0
+PRIORITY_NORMAL: int = 1
+
+# (calls, period in seconds) of each route family, a conservative reading of the Nobitex limits
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[int, float]] = {
+    'market_data': (300, 60),
+    'orders': (300, 600),
+    'wallets': (60, 60),
+    'auth': (30, 1800),
+    'default': (60, 60),
+}
+
+# First matching route prefix decides the family
+_ROUTE_FAMILIES: Tuple[Tuple[str, str], ...] = (
+    ('/market/orders/', 'orders'),
+    ('/security/emergency-cancel/', 'orders'),
+    ('/market/', 'market_data'),
+    ('/v3/orderbook/', 'market_data'),
+    ('/v2/depth/', 'market_data'),
+    ('/v2/trades/', 'market_data'),
+    ('/v2/options/', 'market_data'),
+    ('/users/wallets/', 'wallets'),
+    ('/v2/wallets/', 'wallets'),
+    ('/wallets/', 'wallets'),
+    ('/auth/', 'auth'),
+)
+
+# Order placement and cancellation go ahead of every queued request
+_HIGH_PRIORITY_ROUTES: Tuple[str, ...] = (
+    '/market/orders/add',
+    '/market/orders/update-status',
+    '/market/orders/cancel-old',
+    '/security/emergency-cancel/',
+)
+
+class TokenBucket:
+    """
+    Token bucket allowing `calls` requests per `period` seconds, with bursts up to `calls`.
+    Not thread-safe on its own, RateLimiter guards it with its lock.
+    """
+    __slots__ = ('rate', 'capacity', 'tokens', '_updated')
+
+    def __init__(self, calls: int, period: float) -> None:
+        """
+        Initiation.
+
+        Args:
+            calls (int): Number of requests allowed in a period.
+            period (float): Length of the period in seconds.
+        """
+        self.rate = calls / period
+        self.capacity = float(calls)
+        self.tokens = float(calls)
+        self._updated = monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, now: float) -> float:
+        """
+        Seconds until a token is available, 0 if one is available now.
+        """
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        self.tokens -= 1
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(rate={self.rate:.3f}/s, tokens={self.tokens:.1f}/{self.capacity:.0f})'
+
+class RateLimiter:
+    """
+    Client side rate limiter with one token bucket per route family and an optional global bucket.
+
+    Waiting requests are served by priority, then arrival order, so order placement and
+    cancellation are never stuck behind queued market data polling.
+    """
+    def __init__(
+            self,
+            limits: Optional[Dict[str, Tuple[int, float]]] = None,
+            global_limit: Optional[Tuple[int, float]] = None,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            limits (Dict[str, Tuple[int, float]], optional): (calls, period) per family, merged over DEFAULT_RATE_LIMITS.
+            global_limit (Tuple[int, float], optional): (calls, period) shared by every request. Defaults to None.
+        """
+        limits = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self._buckets: Dict[str, TokenBucket] = {family: TokenBucket(*limit) for family, limit in limits.items()}
+        self._global: Optional[TokenBucket] = TokenBucket(*global_limit) if global_limit else None
+
+        self._condition = threading.Condition(threading.Lock())
+        self._waiters: List[Tuple[int, int, str]] = []  # Sorted (priority, sequence, family)
+        self._sequence = count()
+
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def classify(route: str) -> str:
+        """
+        Family of a route, eg. 'market_data' for '/v3/orderbook/BTCIRT'.
+        """
+        route = route if route.startswith('/') else f'/{route}'
+        for prefix, family in _ROUTE_FAMILIES:
+            if route.startswith(prefix):
+                return family
+        return 'default'
+
+    @staticmethod
+    def priority(route: str) -> int:
+        """
+        Priority of a route, PRIORITY_HIGH for order placement and cancellation.
+        """
+        route = route if route.startswith('/') else f'/{route}'
+        return PRIORITY_HIGH if route.startswith(_HIGH_PRIORITY_ROUTES) else PRIORITY_NORMAL
+
+    def _bucket(self, family: str) -> TokenBucket:
+        return self._buckets.get(family) or self._buckets['default']
+
+    def _buckets_for(self, family: str) -> List[TokenBucket]:
+        bucket = self._bucket(family)
+        return [bucket, self._global] if self._global else [bucket]
+
+    def _enqueue(self, route: str) -> Tuple[int, int, str]:
+        ticket = (self.priority(route), next(self._sequence), self.classify(route))
+        insort(self._waiters, ticket)
+        return ticket
+
+    def _ready_in(self, ticket: Tuple[int, int, str], buckets: List[TokenBucket]) -> float:
+        now = monotonic()
+        for waiter in self._waiters:
+            if waiter == ticket:
+                break
+            # A waiter ahead for the same bucket goes first. One of another family only competes for the
+            # global bucket, it goes first only if its own bucket can serve it now: a starved family must not
+            # hold back the others
+            bucket = self._bucket(waiter[2])
+            if bucket is buckets[0] or (self._global is not None and bucket.wait_time(now) <= 0):
+                return 0.01
+
+        return max(bucket.wait_time(now) for bucket in buckets)
+
+    def _take(self, ticket: Tuple[int, int, str], buckets: List[TokenBucket]) -> None:
+        for bucket in buckets:
+            bucket.consume()
+        self._release(ticket)
+
+    def _release(self, ticket: Tuple[int, int, str]) -> None:
+        self._waiters.remove(ticket)
+        self._condition.notify_all()
+
+    def acquire(self, route: str) -> float:
+        """
+        Block until the route may be requested.
+
+        Args:
+            route (str): Route of the request.
+
+        Returns:
+            float: Seconds spent in the queue.
+        """
+        start = monotonic()
+        with self._condition:
+            ticket = self._enqueue(route)
+            buckets = self._buckets_for(ticket[2])
+            throttled = False
+            try:
+                while (delay := self._ready_in(ticket, buckets)) > 0:
+                    throttled = True
+                    self._condition.wait(delay)
+            except BaseException:
+                self._release(ticket)
+                raise
+            self._take(ticket, buckets)
+
+        return self._record(ticket[2], monotonic() - start, throttled)
+
+    async def acquire_async(self, route: str) -> float:
+        """
+        Wait without blocking the event loop until the route may be requested.
+
+        Args:
+            route (str): Route of the request.
+
+        Returns:
+            float: Seconds spent in the queue.
+        """
+        # Only loaded by the async client, asyncio is not needed to import the package
+        import asyncio
+
+        start = monotonic()
+        with self._condition:
+            ticket = self._enqueue(route)
+            buckets = self._buckets_for(ticket[2])
+
+        throttled = False
+        try:
+            while True:
+                with self._condition:
+                    delay = self._ready_in(ticket, buckets)
+                    if delay <= 0:
+                        self._take(ticket, buckets)
+                        break
+                throttled = True
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._condition:
+                if ticket in self._waiters:
+                    self._release(ticket)
+            raise
+
+        return self._record(ticket[2], monotonic() - start, throttled)
+
+    def record_rejection(self, route: str) -> None:
+        """
+        Count a request the server rejected with HTTP 429.
+        """
+        with self._condition:
+            self._family_stats(self.classify(route))['rejected'] += 1
+
+    def _family_stats(self, family: str) -> Dict[str, float]:
+        if family not in self._stats:
+            self._stats[family] = {'requests': 0, 'throttled': 0, 'rejected': 0, 'queued_time': 0.0, 'max_queued_time': 0.0}
+        return self._stats[family]
+
+    def _record(self, family: str, queued: float, throttled: bool) -> float:
+        with self._condition:
+            stats = self._family_stats(family)
+            stats['requests'] += 1
+            if throttled:
+                stats['throttled'] += 1
+                stats['queued_time'] += queued
+                stats['max_queued_time'] = max(stats['max_queued_time'], queued)
+        return queued
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Counters of every route family.
+
+        Returns:
+            Dict[str, Dict[str, float]]: requests, throttled (had to wait), rejected (HTTP 429),
+            queued_time and max_queued_time (seconds) per family.
+        """
+        with self._condition:
+            return {family: dict(stats) for family, stats in self._stats.items()}
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(families={list(self._buckets)}, global={self._global})'
@@ -0,0 +1,176 @@
+# nobitex_api\_retry.py
+import random, threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import Iterable, Optional
+
+from ._exceptions import CircuitOpenError
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again and how long to wait before it.
+    Waits grow exponentially with full jitter, a Retry-After header from the server takes precedence.
+    """
+    def __init__(
+            self,
+            total: int = 3,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 30.0,
+            methods: Iterable[str] = ('GET',),
+            statuses: Iterable[int] = (429, 500, 502, 503, 504),
+            retry_on_errors: bool = True,
+            respect_retry_after: bool = True,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            total (int, optional): Maximum number of retries. Defaults to 3.
+            backoff_factor (float, optional): Base of the exponential backoff in seconds. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound of a computed backoff in seconds. Defaults to 30.
+            methods (Iterable[str], optional): HTTP methods allowed to retry. Defaults to only the idempotent GET.
+            statuses (Iterable[int], optional): Response codes to retry. Defaults to 429 and transient 5xx.
+            retry_on_errors (bool, optional): Retry connection errors and timeouts. Defaults to True.
+            respect_retry_after (bool, optional): Wait as long as the Retry-After header asks. Defaults to True.
+        """
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.methods = frozenset(method.upper() for method in methods)
+        self.statuses = frozenset(statuses)
+        self.retry_on_errors = retry_on_errors
+        self.respect_retry_after = respect_retry_after
+
+    def allows(self, method: str) -> bool:
+        """
+        Whether requests with this HTTP method may be retried at all.
+        """
+        return self.total > 0 and method.upper() in self.methods
+
+    def should_retry_status(self, status_code: int, attempt: int) -> bool:
+        return attempt < self.total and status_code in self.statuses
+
+    def should_retry_error(self, attempt: int) -> bool:
+        return attempt < self.total and self.retry_on_errors
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of retries already made.
+            retry_after (str, optional): Value of the Retry-After response header.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, self._parse_retry_after(retry_after))
+
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> float:
+        # Either delay seconds or an HTTP date
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return 0.0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(total={self.total}, methods={sorted(self.methods)}, backoff_factor={self.backoff_factor})'
+
+class CircuitBreaker:
+    """
+    Fails fast while a host is degraded.
+
+    After `failure_threshold` consecutive failures (connection errors or 5xx) the circuit opens
+    and requests raise CircuitOpenError without being sent. Once `recovery_timeout` passes a
+    single trial request is let through, its success closes the circuit and its failure opens it again.
+    """
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            recovery_timeout: float = 30.0,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures that open the circuit. Defaults to 5.
+            recovery_timeout (float, optional): Seconds the circuit stays open before a trial request. Defaults to 30.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """
+        'closed', 'open' or 'half-open'.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if monotonic() - self._opened_at >= self.recovery_timeout:
+                return 'half-open'
+            return 'open'
+
+    def before_request(self) -> None:
+        """
+        Raise CircuitOpenError if the request must not be sent.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            remaining = self.recovery_timeout - (monotonic() - self._opened_at)
+            if remaining <= 0 and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+        raise CircuitOpenError(f"Circuit open after {self._failures} consecutive failures, retry in {max(remaining, 0):.1f}s")
+
+    def record(self, status_code: int) -> None:
+        """
+        Record the outcome of a request from its status code.
+        """
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = monotonic()
+
+    def release(self) -> None:
+        """
+        Free the trial of a request abandoned before its outcome was known (eg. cancelled), without recording it.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(state={self.state}, failures={self._failures})'
@@ -0,0 +1,187 @@
+# nobitex_api\_stats_table.py
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from ._arrays import _require_numpy
+from ._currency import Currency, CurrencyManager
+from ._type_hints import CurrencyAgainstMode
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Column name and response key of the numeric stats fields
+STATS_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('latest', 'latest'),
+    ('best_buy', 'bestBuy'),
+    ('best_sell', 'bestSell'),
+    ('volume_src', 'volumeSrc'),
+    ('volume_dst', 'volumeDst'),
+    ('mark', 'mark'),
+    ('day_low', 'dayLow'),
+    ('day_high', 'dayHigh'),
+    ('day_open', 'dayOpen'),
+    ('day_close', 'dayClose'),
+    ('day_change', 'dayChange'),
+)
+
+# Columns compared by StatsTable.diff by default
+DIFF_COLUMNS: Tuple[str, ...] = ('latest', 'best_buy', 'best_sell', 'volume_src')
+
+def _to_float(value) -> float:
+    return float(value) if value not in (None, '') else math.nan
+
+class StatsTable:
+    """
+    Stats of many markets in aligned float64 columns, one row per market.
+    Returned by `Market.get_stats` with output='array'.
+
+    Rows are found by response key ('btc-rls'), pair symbol ('BTCIRT') or (currency, against)
+    through `CurrencyManager`. Missing values are NaN.
+
+    Usage:
+        table = client.Market.get_stats(output='array')
+        table['latest'][table.index('BTCIRT')]
+        moved = table.diff(previous)  # only the markets that changed
+    """
+    def __init__(
+            self,
+            markets: List[str],
+            columns: Dict[str, 'np.ndarray'],
+            is_closed: Optional['np.ndarray'] = None,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            markets (List[str]): Response key of every row (eg. 'btc-rls').
+            columns (Dict[str, np.ndarray]): float64 column of every field of STATS_COLUMNS.
+            is_closed (np.ndarray, optional): bool column of closed markets.
+        """
+        np = _require_numpy()
+        self.markets = markets
+        self.columns = columns
+        self.is_closed = is_closed if is_closed is not None else np.zeros(len(markets), dtype=bool)
+        self._rows: Dict[str, int] = {market: row for row, market in enumerate(markets)}
+        self._currencies: Optional[List[Tuple[Optional[Currency], Optional[CurrencyAgainstMode]]]] = None
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'StatsTable':
+        """
+        Build the table of a `Market.get_stats` response.
+        """
+        np = _require_numpy()
+        stats = data.get('stats', {})
+        markets = list(stats)
+        rows = list(stats.values())
+        columns = {
+            name: np.array([_to_float(row.get(key)) for row in rows], dtype=np.float64)
+            for name, key in STATS_COLUMNS
+        }
+        is_closed = np.array([bool(row.get('isClosed')) for row in rows], dtype=bool)
+        return cls(markets, columns, is_closed)
+
+    def _key(self, market: str | Tuple[Currency, CurrencyAgainstMode]) -> str:
+        """
+        Response key of a market given in any supported form.
+        """
+        if isinstance(market, str):
+            if market in self._rows:
+                return market
+            currency, against = CurrencyManager.parse_market(market)
+        else:
+            currency, against = market
+        return f"{currency.symbol}-{'rls' if against == 'irt' else against}"
+
+    def index(self, market: str | Tuple[Currency, CurrencyAgainstMode]) -> int:
+        """
+        Row of a market.
+
+        Raises:
+            KeyError: If the market is not in the table.
+        """
+        return self._rows[self._key(market)]
+
+    def __contains__(self, market) -> bool:
+        try:
+            return self._key(market) in self._rows
+        except ValueError:
+            return False
+
+    def __getitem__(self, column: str) -> 'np.ndarray':
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+    def currencies(self) -> List[Tuple[Optional[Currency], Optional[CurrencyAgainstMode]]]:
+        """
+        (currency, against) of every row, (None, None) for markets unknown to CurrencyManager.
+        """
+        if self._currencies is None:
+            parsed = []
+            for market in self.markets:
+                try:
+                    parsed.append(CurrencyManager.parse_market(market))
+                except ValueError:
+                    parsed.append((None, None))
+            self._currencies = parsed
+        return self._currencies
+
+    def row(self, market: str | Tuple[Currency, CurrencyAgainstMode]) -> Dict[str, float]:
+        """
+        Fields of one market.
+        """
+        row = self.index(market)
+        return {name: float(column[row]) for name, column in self.columns.items()}
+
+    def take(self, rows: 'np.ndarray') -> 'StatsTable':
+        """
+        Table of the selected rows, given as indices or a boolean mask.
+        """
+        np = _require_numpy()
+        rows = np.flatnonzero(rows) if rows.dtype == bool else rows
+        return StatsTable(
+            [self.markets[row] for row in rows],
+            {name: column[rows] for name, column in self.columns.items()},
+            self.is_closed[rows],
+        )
+
+    def changed(self, previous: Optional['StatsTable'], columns: Iterable[str] = DIFF_COLUMNS) -> 'np.ndarray':
+        """
+        Boolean mask of the rows that are new or differ from `previous` in any of `columns`.
+        """
+        np = _require_numpy()
+        if previous is None:
+            return np.ones(len(self), dtype=bool)
+
+        if self.markets == previous.markets:
+            # Same markets in the same order, the usual case for repeated calls: compare columns directly
+            rows = np.arange(len(self))
+        else:
+            rows = np.array([previous._rows.get(market, -1) for market in self.markets], dtype=np.intp)
+
+        present = rows >= 0
+        mask = ~present
+        safe_rows = np.where(present, rows, 0)
+        for name in columns:
+            current = self.columns[name]
+            before = previous.columns[name][safe_rows] if len(previous) else np.full(len(self), np.nan)
+            # NaN on both sides is no change
+            mask |= present & ~((current == before) | (np.isnan(current) & np.isnan(before)))
+        return mask
+
+    def diff(self, previous: Optional['StatsTable'], columns: Iterable[str] = DIFF_COLUMNS) -> 'StatsTable':
+        """
+        Markets that are new or whose latest, best bid/ask or volume changed since `previous`.
+
+        Args:
+            previous (StatsTable, optional): Earlier snapshot, None returns every market.
+            columns (Iterable[str], optional): Columns compared. Defaults to latest, best_buy, best_sell and volume_src.
+
+        Returns:
+            StatsTable: The changed rows of this table.
+        """
+        return self.take(self.changed(previous, columns))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(markets={len(self)})'
@@ -0,0 +1,129 @@
+# nobitex_api\_trade_tail.py
+import time
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from ._currency import Currency
+from ._type_hints import CurrencyAgainstMode
+
+TradeSignature = Tuple[int, str, str, str]
+
+def _signature(trade: dict) -> TradeSignature:
+    return trade.get('time'), trade.get('price'), trade.get('volume'), trade.get('type')
+
+class TradeTail:
+    """
+    Follows the public trades of one market and returns only the trades not seen before.
+
+    Signatures (time, price, volume, type) of the seen trades are kept in a bounded ring buffer.
+    If a poll no longer contains the newest seen trade, trades printed between the two polls were
+    pushed out of the server window: the poll is counted in `gaps` and `missed` is set.
+
+    Usage:
+        tail = TradeTail(client, CurrencyManager.btc, 'irt')
+        for trade in tail.follow(interval=1):
+            ...
+    """
+    def __init__(
+            self,
+            client,
+            currency: Currency,
+            against: CurrencyAgainstMode = 'irt',
+            maxlen: int = 1000,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            client (NobitexClient | AsyncNobitexClient): Client used for `Trades.get_trades`.
+            currency (Currency): Currency of the market.
+            against (CurrencyAgainstMode, optional): Quote currency of the market. Defaults to 'irt'.
+            maxlen (int, optional): Number of trade signatures remembered, keep it above the server window. Defaults to 1000.
+        """
+        self._client = client
+        self.currency = currency
+        self.against = against
+
+        self._ring: Deque[TradeSignature] = deque()
+        self._seen: Dict[TradeSignature, int] = {}
+        self._maxlen = maxlen
+
+        self.cursor: Optional[TradeSignature] = None
+        self.missed = False
+        self.gaps = 0
+        self.polls = 0
+
+    def _remember(self, signature: TradeSignature) -> None:
+        if len(self._ring) >= self._maxlen:
+            evicted = self._ring.popleft()
+            if self._seen[evicted] == 1:
+                del self._seen[evicted]
+            else:
+                self._seen[evicted] -= 1
+
+        self._ring.append(signature)
+        self._seen[signature] = self._seen.get(signature, 0) + 1
+
+    def feed(self, data: dict) -> List[dict]:
+        """
+        Process a trades response and return its unseen trades.
+
+        Args:
+            data (dict): Response of `Trades.get_trades`.
+
+        Returns:
+            List[dict]: New trades, oldest first.
+        """
+        # The server lists newest first, reversing keeps equal times in print order
+        trades = sorted(reversed(data.get('trades', [])), key=lambda trade: trade.get('time') or 0)
+        self.polls += 1
+
+        # Identical prints are told apart by how many of them were already seen
+        counts: Dict[TradeSignature, int] = {}
+        new_trades: List[dict] = []
+        for trade in trades:
+            signature = _signature(trade)
+            counts[signature] = counts.get(signature, 0) + 1
+            if counts[signature] > self._seen.get(signature, 0):
+                new_trades.append(trade)
+
+        self.missed = bool(
+            self.cursor is not None
+            and trades
+            and self.cursor not in counts
+            and (trades[0].get('time') or 0) >= self.cursor[0]
+        )
+        if self.missed:
+            self.gaps += 1
+
+        for trade in new_trades:
+            self._remember(_signature(trade))
+        if trades:
+            self.cursor = _signature(trades[-1])
+
+        return new_trades
+
+    def poll(self) -> List[dict]:
+        """
+        Fetch the latest trades and return the unseen ones, oldest first.
+        Returns an awaitable on AsyncNobitexClient.
+        """
+        return self._client._chain(
+            self._client.Trades.get_trades(self.currency, self.against),
+            self.feed,
+        )
+
+    def follow(self, interval: float = 1.0) -> Iterator[dict]:
+        """
+        Poll forever and yield every new trade, oldest first.
+
+        Args:
+            interval (float, optional): Seconds between polls. Defaults to 1.
+        """
+        while True:
+            started = time.monotonic()
+            yield from self.poll()
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.currency}, {self.against}, polls={self.polls}, gaps={self.gaps})'
@@ -6,10 +6,12 @@ NobitexBool: TypeAlias = Literal['yes', 'no']
 NobitexCaptcha: TypeAlias = Literal['api', None]
 
 CurrencyAgainstMode: TypeAlias = Literal['irt', 'usdt']
+ResponseOutput: TypeAlias = Literal['dict', 'raw', 'model', 'array']
 
 __all__ = [
     'RequestMethod',
     'NobitexBool',
     'NobitexCaptcha',
     'CurrencyAgainstMode',
+    'ResponseOutput',
 ]
\ No newline at end of file
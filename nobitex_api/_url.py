@@ -3,8 +3,10 @@ from typing import LiteralString
 
 NobitexAPI: LiteralString = 'https://api.nobitex.ir'
 TestNobitexAPI: LiteralString = 'https://testnetapi.nobitex.ir'
+NobitexWebSocketURL: LiteralString = 'wss://wss.nobitex.ir/connection/websocket'
 
 __all__ = [
     'NobitexAPI',
     'TestNobitexAPI',
+    'NobitexWebSocketURL',
 ]
\ No newline at end of file
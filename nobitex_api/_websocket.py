@@ -0,0 +1,326 @@
+# nobitex_api\_websocket.py
+import asyncio, inspect, json, logging
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import websockets
+    from websockets.exceptions import ConnectionClosed, InvalidHandshake
+except ImportError:
+    websockets = None
+    ConnectionClosed = InvalidHandshake = OSError
+
+from ._currency import Currency
+from ._exceptions import NobitexException
+from ._type_hints import CurrencyAgainstMode
+from ._url import NobitexWebSocketURL
+
+logger = logging.getLogger(__name__)
+
+# Centrifugo error codes that mean the connection token must be renewed
+_TOKEN_ERROR_CODES = {109, 3500}
+
+class NobitexWebSocket:
+    """
+    Streaming client for the Nobitex WebSocket (Centrifugo) API.
+
+    Public channels stream orderbook and trades of a market, private channels stream the
+    user's orders and fills. Dropped connections are re-established with exponential backoff,
+    every channel is subscribed again and the connection token is fetched again.
+    Payloads are decoded to the same dicts as the REST routes, eg. orderbook pushes have the
+    shape of `Orderbook.get_orders` and can be fed to `OrderBook.update`.
+
+    Usage:
+        ws = NobitexWebSocket(client)
+        ws.subscribe_orderbook(CurrencyManager.btc, 'irt', book.update)
+        await ws.run()
+    """
+    def __init__(
+            self,
+            client = None,
+            url: str = NobitexWebSocketURL,
+            reconnect_delay: float = 1.0,
+            max_reconnect_delay: float = 30.0,
+            verbose: bool = False,
+        ) -> None:
+        """
+        Initiation.
+
+        Args:
+            client (NobitexClient | AsyncNobitexClient, optional): Client used to fetch the connection token
+                with `Auth.get_web_socket_token`. Required for private channels.
+            url (str, optional): WebSocket URL, point it to a local server for testing. Defaults to NobitexWebSocketURL.
+            reconnect_delay (float, optional): First delay in seconds before reconnecting. Defaults to 1.
+            max_reconnect_delay (float, optional): Maximum delay in seconds between reconnects. Defaults to 30.
+            verbose (bool, optional): Prints the received messages. Defaults to False.
+        """
+        if websockets is None:
+            raise ImportError("websockets is required for NobitexWebSocket, install it with `pip install py-nobitex-api[websocket]`.")
+
+        self._client = client
+        self._url = url
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._verbose = verbose
+
+        self._subscriptions: Dict[str, List[Callable[[dict], Any]]] = {}
+        self._private_channels: set = set()
+        self._token: Optional[str] = None
+        self._ws = None
+        self._running = False
+        self._command_id = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._close_task: Optional[asyncio.Task] = None
+
+        self.reconnects = 0
+
+    # Subscriptions
+    def subscribe(
+            self,
+            channel: str,
+            callback: Callable[[dict], Any],
+            private: bool = False,
+        ) -> None:
+        """
+        Subscribe a callback to a channel. Callbacks may be plain functions or coroutine functions.
+        An exception raised by a callback is logged, it does not stop the other callbacks or `run`.
+
+        Args:
+            channel (str): Centrifugo channel name, eg. 'public:orderbook-BTCIRT'.
+            callback (Callable): Called with the decoded payload of every publication.
+            private (bool, optional): Whether the channel needs an authenticated connection. Defaults to False.
+        """
+        if private:
+            if self._client is None:
+                raise ValueError('A client is required to subscribe to private channels')
+            self._private_channels.add(channel)
+
+        is_new = channel not in self._subscriptions
+        self._subscriptions.setdefault(channel, []).append(callback)
+
+        if is_new and self._ws is not None:
+            asyncio.get_running_loop().create_task(self._send(self._ws, {'subscribe': {'channel': channel}}))
+
+    def unsubscribe(self, channel: str) -> None:
+        """
+        Remove every callback of a channel.
+
+        Args:
+            channel (str): Channel name.
+        """
+        self._subscriptions.pop(channel, None)
+        self._private_channels.discard(channel)
+
+        if self._ws is not None:
+            asyncio.get_running_loop().create_task(self._send(self._ws, {'unsubscribe': {'channel': channel}}))
+
+    def subscribe_orderbook(
+            self,
+            currency: Currency,
+            against: CurrencyAgainstMode = 'irt',
+            callback: Callable[[dict], Any] = print,
+        ) -> None:
+        """
+        Stream the orderbook of a market, payloads have the shape of `Orderbook.get_orders`.
+        """
+        self.subscribe(f'public:orderbook-{currency.get(against)}', callback)
+
+    def subscribe_trades(
+            self,
+            currency: Currency,
+            against: CurrencyAgainstMode = 'irt',
+            callback: Callable[[dict], Any] = print,
+        ) -> None:
+        """
+        Stream the trades of a market, payloads have the shape of `Trades.get_trades`.
+        """
+        self.subscribe(f'public:trades-{currency.get(against)}', callback)
+
+    def subscribe_orders(
+            self,
+            auth_param: str,
+            callback: Callable[[dict], Any] = print,
+        ) -> None:
+        """
+        Stream updates of the user's orders.
+
+        Args:
+            auth_param (str): `websocketAuthParam` from the profile returned by `Users.get_profile`.
+            callback (Callable): Called with each order update.
+        """
+        self.subscribe(f'private:orders#{auth_param}', callback, private=True)
+
+    def subscribe_fills(
+            self,
+            auth_param: str,
+            callback: Callable[[dict], Any] = print,
+        ) -> None:
+        """
+        Stream the user's fills (private trades).
+
+        Args:
+            auth_param (str): `websocketAuthParam` from the profile returned by `Users.get_profile`.
+            callback (Callable): Called with each fill.
+        """
+        self.subscribe(f'private:trades#{auth_param}', callback, private=True)
+
+    # Connection
+    async def run(self) -> None:
+        """
+        Connect and dispatch messages until `stop` is called, reconnecting on connection and handshake errors.
+
+        Raises:
+            NobitexException: If the server rejects a subscription.
+        """
+        self._running = True
+        delay = self._reconnect_delay
+
+        while self._running:
+            try:
+                async with websockets.connect(self._url) as ws:
+                    await self._handshake(ws)
+                    self._ws = ws
+                    delay = self._reconnect_delay
+                    await self._read_loop(ws)
+
+            # InvalidHandshake covers upgrades refused by the server (eg. a 502 or 503 while it restarts)
+            except (ConnectionClosed, InvalidHandshake, OSError, asyncio.TimeoutError, _TokenExpired) as e:
+                if self._verbose:
+                    print(f'WebSocket disconnected: {e!r}')
+
+            finally:
+                self._ws = None
+                if self._refresh_task is not None:
+                    self._refresh_task.cancel()
+                    self._refresh_task = None
+
+            if not self._running:
+                break
+
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    async def stop(self) -> None:
+        """
+        Stop `run` and close the connection.
+        """
+        self._running = False
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def _handshake(self, ws) -> None:
+        connect: Dict[str, Any] = {'name': 'py-nobitex-api'}
+        if self._private_channels:
+            self._token = await self._fetch_token()
+            connect['token'] = self._token
+
+        command_id = await self._send(ws, {'connect': connect})
+
+        # Wait for the connect reply, pushes can not arrive before it
+        reply = None
+        while reply is None:
+            for message in self._decode(await ws.recv()):
+                if message == {}:
+                    await ws.send('{}')
+                elif message.get('id') == command_id:
+                    reply = message
+
+        self._check_reply(reply)
+        self._schedule_refresh(ws, reply.get('connect', {}))
+
+        for channel in list(self._subscriptions):
+            await self._send(ws, {'subscribe': {'channel': channel}})
+
+    async def _read_loop(self, ws) -> None:
+        async for raw in ws:
+            for message in self._decode(raw):
+                if self._verbose:
+                    print(f'WebSocket message: {message}')
+
+                if message == {}:
+                    # Server ping
+                    await ws.send('{}')
+
+                elif 'push' in message:
+                    await self._dispatch(message['push'])
+
+                elif 'id' in message:
+                    self._check_reply(message)
+
+    async def _dispatch(self, push: dict) -> None:
+        channel = push.get('channel')
+        publication = push.get('pub')
+        if publication is None or channel not in self._subscriptions:
+            return
+
+        data = publication.get('data')
+        if isinstance(data, str):
+            data = json.loads(data)
+        if channel.startswith('public:trades-') and isinstance(data, dict) and 'trades' not in data:
+            data = {'status': 'ok', 'trades': [data]}
+
+        for callback in list(self._subscriptions.get(channel, [])):
+            try:
+                result = callback(data)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception('WebSocket callback %r failed on %s', callback, channel)
+
+    def _check_reply(self, message: dict) -> None:
+        error = message.get('error')
+        if not error:
+            return
+
+        if error.get('code') in _TOKEN_ERROR_CODES:
+            self._token = None
+            raise _TokenExpired(error)
+
+        raise NobitexException(f"WebSocket error: {error}")
+
+    def _schedule_refresh(self, ws, connect_reply: dict) -> None:
+        # Renew the token before the server expires the connection
+        if not (connect_reply.get('expires') and connect_reply.get('ttl')):
+            return
+
+        async def _refresh(ttl: float) -> None:
+            while True:
+                await asyncio.sleep(ttl * 0.8)
+                self._token = await self._fetch_token()
+                await self._send(ws, {'refresh': {'token': self._token}})
+
+        def _refresh_done(task: asyncio.Task) -> None:
+            if task.cancelled() or task.exception() is None:
+                return
+            logger.error('WebSocket token refresh failed, reconnecting', exc_info=task.exception())
+            # Closing the connection ends the read loop, `run` reconnects with a new token
+            self._close_task = asyncio.ensure_future(ws.close())
+
+        self._refresh_task = asyncio.get_running_loop().create_task(_refresh(connect_reply['ttl']))
+        self._refresh_task.add_done_callback(_refresh_done)
+
+    async def _fetch_token(self) -> str:
+        if asyncio.iscoroutinefunction(self._client._send_request):
+            return await self._client.Auth.get_web_socket_token()
+        return await asyncio.to_thread(self._client.Auth.get_web_socket_token)
+
+    async def _send(self, ws, command: dict) -> int:
+        self._command_id += 1
+        command['id'] = self._command_id
+        await ws.send(json.dumps(command))
+        return self._command_id
+
+    @staticmethod
+    def _decode(raw: str | bytes) -> List[dict]:
+        # Centrifugo batches several JSON messages in one frame separated by new lines
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        return [json.loads(line) for line in raw.splitlines() if line.strip()]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._url}, channels={len(self._subscriptions)})'
+
+class _TokenExpired(Exception):
+    """
+    The server rejected the connection token, a new one is fetched on reconnect.
+    """
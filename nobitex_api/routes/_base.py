@@ -1,5 +1,9 @@
 # nobitex_api\routes\_base.py
-from typing import Literal, Optional
+import inspect
+from typing import Any, Callable, Dict, Iterable, Literal, Optional, Tuple
+from nobitex_api._currency import Currency
+from nobitex_api._pagination import PrefetchIterator
+from nobitex_api._type_hints import CurrencyAgainstMode, ResponseOutput
 
 class NobitexRoute:
     """
@@ -35,6 +39,92 @@ class NobitexRoute:
 
         return f"{(f'/{version}' if version else '')}/{self._route_path}/{'/'.join(addition)}"
 
+    def _check_output(self, output: ResponseOutput, *modes: str) -> None:
+        """
+        Reject an output mode the route does not support, before any request is sent.
+
+        Args:
+            output (ResponseOutput): Requested output mode.
+            *modes (str): Output modes supported by the route.
+
+        Raises:
+            ValueError: If `output` is not one of `modes`.
+        """
+        if output not in modes:
+            raise ValueError(f"Output '{output}' is not supported by {self.__class__.__name__}")
+
+    def _output(
+            self,
+            result: dict,
+            output: ResponseOutput,
+            model: Optional[Callable[[dict], Any]] = None,
+            array: Optional[Callable[[dict], Any]] = None,
+        ) -> Any:
+        """
+        Convert a response to the requested output mode.
+
+        Args:
+            result (dict): Value returned by `_send_request`.
+            output (ResponseOutput): Requested output mode.
+            model (Callable, optional): Builds the typed model of the response, used when output is 'model'.
+            array (Callable, optional): Builds the numpy arrays of the response, used when output is 'array'.
+
+        Returns:
+            Any: The response in the requested output mode.
+        """
+        converter = {'model': model, 'array': array}.get(output)
+        if converter is not None:
+            return self._client._chain(result, converter)
+        if output in ('model', 'array'):
+            raise ValueError(f"Output '{output}' is not supported by {self.__class__.__name__}")
+        return result
+
+    def _paginate(
+            self,
+            fetch: Callable[[Any], Tuple[Any, Any, bool]],
+            cursor: Any,
+        ) -> PrefetchIterator:
+        """
+        Iterate pages of a route, prefetching the next page in the background.
+
+        Args:
+            fetch (Callable): Fetches the page at a cursor and returns (page, next_cursor, has_next).
+            cursor (Any): Cursor of the first page.
+
+        Returns:
+            PrefetchIterator: Iterator over the pages.
+        """
+        if inspect.iscoroutinefunction(self._client._send_request):
+            raise TypeError(f'Paginators are not supported by {self._client.__class__.__name__}')
+        return PrefetchIterator(fetch, cursor)
+
+    def _batch(
+            self,
+            function: Callable[[Currency, CurrencyAgainstMode], dict],
+            currencies: Iterable[Currency],
+            against: CurrencyAgainstMode = 'irt',
+            max_workers: int = 10,
+            **kwargs,
+        ) -> Dict[str, dict | Exception]:
+        """
+        Call a single-market route method for several currencies concurrently.
+
+        Args:
+            function (Callable): Route method taking a currency and against mode.
+            currencies (Iterable[Currency]): Currencies to request.
+            against (CurrencyAgainstMode, optional): Market quote currency. Defaults to 'irt'.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 10.
+            kwargs: Extra keyword arguments passed to `function`.
+
+        Returns:
+            Dict[str, dict | Exception]: Response or error of each market, keyed by market symbol (eg. 'BTCIRT').
+        """
+        calls = {
+            currency.get(against): (lambda currency=currency: function(currency, against, **kwargs))
+            for currency in currencies
+        }
+        return self._client._run_batch(calls, max_workers=max_workers)
+
     def __init__(self, _client):
         """
         Initializes the SarvModule instance with a given client.
@@ -39,19 +39,23 @@ class Auth(NobitexRoute):
         if not post_parms['username'] or not post_parms['password']:
             raise ValueError('Username and password are required')
 
-        data = self._client._send_request(
-            method = 'POST',
-            route = self._create_route('login', ''), # Ensures Addition of / at the end
-            post_parms = post_parms,
-        )
+        def _store_token(data: dict) -> str:
+            if data:
+                self._client._token = data.get('key')
+                self._client._device = data.get('device')
+
+            return self._client._token
 
-        if data:
-            self._client._token = data.get('key')
-            self._client._device = data.get('device')
-        
-        return self._client._token
+        return self._client._chain(
+            self._client._send_request(
+                method = 'POST',
+                route = self._create_route('login', ''), # Ensures Addition of / at the end
+                post_parms = post_parms,
+            ),
+            _store_token,
+        )
 
-    def logout(self) -> None:
+    def logout(self) -> dict:
         """
         Clears the access token from the instance.
 
@@ -60,7 +64,7 @@ class Auth(NobitexRoute):
         if self._client._token:
             self._client._token = ''
 
-        self._client._send_request(
+        return self._client._send_request(
             method = 'POST',
             route = self._create_route('logout', ''), # Ensures Addition of / at the end
         )
@@ -70,7 +74,10 @@ class Auth(NobitexRoute):
         Retrieves the web socket token.
         """
 
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route('ws', 'token', ''), # Ensures Addition of / at the end
-        ).get('token')
\ No newline at end of file
+        return self._client._chain(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route('ws', 'token', ''), # Ensures Addition of / at the end
+            ),
+            lambda data: data.get('token'),
+        )
\ No newline at end of file
@@ -1,6 +1,9 @@
 # nobitex_api\routes\depth.py
+from typing import Dict, List
 from nobitex_api._currency import Currency
-from nobitex_api._type_hints import CurrencyAgainstMode
+from nobitex_api._arrays import book_to_arrays
+from nobitex_api._models import BookSnapshot
+from nobitex_api._type_hints import CurrencyAgainstMode, ResponseOutput
 from ._base import NobitexRoute
 
 """
@@ -18,20 +21,52 @@ class Depth(NobitexRoute):
     def get_depth(
             self, 
             currency: Currency,
-            against: CurrencyAgainstMode = 'irt'
-        ) -> dict:
+            against: CurrencyAgainstMode = 'irt',
+            output: ResponseOutput = 'dict',
+        ) -> dict | bytes:
         """
         Get market depth for a specific currency.
 
         Args:
             currency (Currency): The currency to get market depth for.
             against (CurrencyAgainstMode, optional): The currency to get market depth against. Defaults to 'irt'
+            output (ResponseOutput, optional): 'dict' for the parsed response, 'raw' for the response body, 'model' for a BookSnapshot, 'array' for BookArrays. Defaults to 'dict'
 
         Returns:
             dict: The market depth for the specified currency.
         """
 
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route(currency.get(against)),
-        )
\ No newline at end of file
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._output(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route(currency.get(against)),
+                raw=output == 'raw',
+            ),
+            output,
+            BookSnapshot.from_response,
+            book_to_arrays,
+        )
+
+    def get_depth_batch(
+            self,
+            currencies: List[Currency],
+            against: CurrencyAgainstMode = 'irt',
+            max_workers: int = 10,
+            output: ResponseOutput = 'dict',
+        ) -> Dict[str, dict | bytes | Exception]:
+        """
+        Get market depth for several currencies concurrently.
+
+        Args:
+            currencies (List[Currency]): Currencies to get market depth for.
+            against (CurrencyAgainstMode, optional): The currency to get market depth against. Defaults to 'irt'
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 10.
+            output (ResponseOutput, optional): Output mode of each response, see `get_depth`. Defaults to 'dict'
+
+        Returns:
+            Dict[str, dict | Exception]: Market depth or the raised error, keyed by market symbol.
+        """
+
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._batch(self.get_depth, currencies, against, max_workers, output=output)
@@ -1,7 +1,13 @@
 # nobitex_api\routes\market.py
-from typing import Literal, Optional
+import time, uuid
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
 from nobitex_api._currency import Currency
-from nobitex_api._type_hints import CurrencyAgainstMode
+from nobitex_api._arrays import candles_to_arrays, CANDLE_COLUMNS
+from nobitex_api._exceptions import NobitexException
+from nobitex_api._models import MarketStats, Order
+from nobitex_api._pagination import PrefetchIterator
+from nobitex_api._stats_table import StatsTable
+from nobitex_api._type_hints import CurrencyAgainstMode, ResponseOutput
 from ._base import NobitexRoute
 
 """
@@ -16,6 +22,24 @@ https://api.nobitex.ir/market/udf/history #Done
 https://api.nobitex.ir/market/global-stats #Done
 """
 
+UdfResolution = Literal['1', '5', '15', '30','60', '180', '240', '360', '720', 'D','2D', '3D']
+
+# Length of a bar of each udf resolution in seconds
+_UDF_RESOLUTION_SECONDS: Dict[str, int] = {
+    '1': 60, '5': 300, '15': 900, '30': 1800, '60': 3600, '180': 10800,
+    '240': 14400, '360': 21600, '720': 43200, 'D': 86400, '2D': 172800, '3D': 259200,
+}
+
+def _symbols(currencies: Optional[Currency | Iterable[Currency]]) -> Optional[str]:
+    """
+    Comma separated symbols of one or several currencies.
+    """
+    if currencies is None:
+        return None
+    if isinstance(currencies, Currency):
+        return currencies.symbol
+    return ','.join(currency.symbol for currency in currencies)
+
 class Market(NobitexRoute):
     """
     Nobitex API Market endpoint.
@@ -24,6 +48,40 @@ class Market(NobitexRoute):
     _route_path: str = 'market'
     _version: str = ''
 
+    def _paginate_ids(
+            self,
+            request: Callable[[int], dict],
+            key: str,
+            from_id: int,
+            convert: Optional[Callable[[dict], Any]] = None,
+        ) -> PrefetchIterator[List[Any]]:
+        """
+        Iterate a list route paged by `fromId`, the next page starts after the highest id of the current one.
+
+        Args:
+            request (Callable): Sends the request of a page for a fromId.
+            key (str): Key of the items list in the response.
+            from_id (int): fromId of the first page.
+            convert (Callable, optional): Converts each item of a page.
+        """
+        def fetch(cursor: int):
+            data = request(cursor)
+            if data.get('status', 'ok') != 'ok':
+                raise NobitexException(f"{key} list error --> Response:{data}")
+
+            # Items before the cursor were already yielded by the previous page
+            page = [item for item in data.get(key, []) if item.get('id') is None or item['id'] >= cursor]
+            page.sort(key=lambda item: item.get('id') or 0)
+            ids = [item['id'] for item in page if item.get('id') is not None]
+            # The cursor stays past the last item at the end, resuming from it picks up new items only
+            next_cursor = max(ids) + 1 if ids else cursor
+            has_next = bool(ids) and data.get('hasNext') is not False
+            if convert is not None:
+                page = [convert(item) for item in page]
+            return page, next_cursor, has_next
+
+        return self._paginate(fetch, from_id)
+
     def add_order(
             self,
             type: Literal['buy', 'sell'],
@@ -75,6 +133,30 @@ class Market(NobitexRoute):
             post_parms = post_parameters,
         )
 
+    def add_orders(
+            self,
+            orders: Iterable[dict],
+            max_workers: int = 10,
+        ) -> Dict[str, dict | Exception]:
+        """
+        Add several orders concurrently.
+        Requests go through the client rate limiter like `add_order`, where order placement has priority.
+
+        Args:
+            orders: Keyword arguments of `add_order` for each order. Orders without a client_order_id get a generated one.
+            max_workers: Maximum number of concurrent requests. Defaults to 10.
+
+        Returns:
+            Dict[str, dict | Exception]: Response or error of each order keyed by its clientOrderId, in input order.
+        """
+        specs = [{**order, 'client_order_id': order.get('client_order_id') or uuid.uuid4().hex} for order in orders]
+        client_order_ids = [spec['client_order_id'] for spec in specs]
+        if len(set(client_order_ids)) != len(client_order_ids):
+            raise ValueError("client_order_id values must be unique.")
+
+        calls = {spec['client_order_id']: (lambda spec=spec: self.add_order(**spec)) for spec in specs}
+        return self._client._run_batch(calls, max_workers=max_workers)
+
     def get_order_status(
             self,
             id: int,
@@ -104,29 +186,31 @@ class Market(NobitexRoute):
 
     def get_orders_list(
             self,
-            type: Literal['buy', 'sell'],
-            trade_type: Literal['spot', 'margin'],
-            src_currency: Currency,
-            dst_currency: Currency,
+            type: Optional[Literal['buy', 'sell']] = None,
+            trade_type: Optional[Literal['spot', 'margin']] = None,
+            src_currency: Optional[Currency] = None,
+            dst_currency: Optional[Currency] = None,
             details: Literal[1, 2] = 1,
             from_id: int = 1,
             order: Optional[Literal['id', 'created_at', 'price']] = None,
-            execution: Literal['market', 'limit', 'stop_market', 'stop_limit'] = 'limit',
+            execution: Optional[Literal['market', 'limit', 'stop_market', 'stop_limit']] = 'limit',
             status: Literal['all', 'open', 'done', 'close'] = 'open',
-        ) -> dict:
+            output: ResponseOutput = 'dict',
+        ) -> dict | bytes | List[Order]:
         """
         Get the list of orders.
 
         Args:
-            type: Type of the order.
-            trade_type: Type of the trade.
-            src_currency: Source currency.
-            dst_currency: Destination currency.
+            type: Type of the order, None for both.
+            trade_type: Type of the trade, None for both.
+            src_currency: Source currency, None for all.
+            dst_currency: Destination currency, None for all.
             details: Details level of the order.
             from_id: Fetch reults after this ID.
             order: Order of the fetched result.
-            execution: Execution type of the order.
+            execution: Execution type of the order, None for all.
             status: Filter by status of the order.
+            output: 'dict' for the parsed response, 'raw' for the response body, 'model' for a list of Order.
             
         Returns:
             dict: Response of the API.
@@ -134,8 +218,8 @@ class Market(NobitexRoute):
         post_params = {
             'type': type,
             'tradeType': trade_type,
-            'srcCurrency': src_currency.symbol,
-            'dstCurrency': dst_currency.symbol,
+            'srcCurrency': src_currency.symbol if src_currency is not None else None,
+            'dstCurrency': dst_currency.symbol if dst_currency is not None else None,
             'details': details,
             'fromId': from_id,
             'order': order,
@@ -144,12 +228,59 @@ class Market(NobitexRoute):
         }
         post_params = {k: v for k, v in post_params.items() if v is not None}
 
-        return self._client._send_request(
-            method = 'GET',
-            route = self._create_route('orders', 'list'),
-            post_parms = post_params,
+        self._check_output(output, 'dict', 'raw', 'model')
+        return self._output(
+            self._client._send_request(
+                method = 'GET',
+                route = self._create_route('orders', 'list'),
+                post_parms = post_params,
+                raw = output == 'raw',
+            ),
+            output,
+            Order.from_response,
         )
 
+    def iter_orders_list(
+            self,
+            type: Literal['buy', 'sell'],
+            trade_type: Literal['spot', 'margin'],
+            src_currency: Currency,
+            dst_currency: Currency,
+            details: Literal[1, 2] = 1,
+            from_id: int = 1,
+            execution: Literal['market', 'limit', 'stop_market', 'stop_limit'] = 'limit',
+            status: Literal['all', 'open', 'done', 'close'] = 'open',
+            output: Literal['dict', 'model'] = 'dict',
+        ) -> PrefetchIterator[List[dict] | List[Order]]:
+        """
+        Iterate the list of orders page by page, ordered by id.
+        The next page is fetched in the background while the current one is consumed.
+        `cursor` of the returned iterator is the fromId of the next page, pass it as `from_id` to resume.
+
+        Args:
+            type: Type of the order.
+            trade_type: Type of the trade.
+            src_currency: Source currency.
+            dst_currency: Destination currency.
+            details: Details level of the order.
+            from_id: Fetch results from this ID.
+            execution: Execution type of the order.
+            status: Filter by status of the order.
+            output: 'dict' for order dicts, 'model' for Order.
+
+        Yields:
+            List[dict] | List[Order]: Orders of a page.
+        """
+        self._check_output(output, 'dict', 'model')
+
+        def request(cursor: int) -> dict:
+            return self.get_orders_list(
+                type, trade_type, src_currency, dst_currency, details,
+                from_id=cursor, order='id', execution=execution, status=status,
+            )
+
+        return self._paginate_ids(request, 'orders', from_id, Order.from_dict if output == 'model' else None)
+
     def update_order_status(
             self,
             status: Literal['active', 'canceled'],
@@ -178,6 +309,32 @@ class Market(NobitexRoute):
             post_parms = post_params,
         )
 
+    def cancel_orders(
+            self,
+            order_ids: Iterable[int] = (),
+            client_order_ids: Iterable[str] = (),
+            max_workers: int = 10,
+        ) -> Dict[int | str, dict | Exception]:
+        """
+        Cancel several orders concurrently with `update_order_status`.
+
+        Args:
+            order_ids: Ids of the orders.
+            client_order_ids: Client order ids of the orders.
+            max_workers: Maximum number of concurrent requests. Defaults to 10.
+
+        Returns:
+            Dict[int | str, dict | Exception]: Response or error of each order keyed by the given id, in input order.
+        """
+        calls = {
+            **{order_id: (lambda order_id=order_id: self.update_order_status('canceled', order_id=order_id)) for order_id in order_ids},
+            **{
+                client_order_id: (lambda client_order_id=client_order_id: self.update_order_status('canceled', clint_order_id=client_order_id))
+                for client_order_id in client_order_ids
+            },
+        }
+        return self._client._run_batch(calls, max_workers=max_workers)
+
     def cancel_old_orders(
             self,
             hours: float,
@@ -220,7 +377,9 @@ class Market(NobitexRoute):
             src_currency: Optional[Currency] = None,
             dst_currency: Optional[Currency] = None,
             from_id : Optional[int] = None,
-        ) -> dict:
+            order: Optional[Literal['id']] = None,
+            output: ResponseOutput = 'dict',
+        ) -> dict | bytes:
         """
         Get the list of trades.
 
@@ -228,6 +387,8 @@ class Market(NobitexRoute):
             src_currency: Source currency.
             dst_currency: Destination currency.
             from_id: From id.
+            order: Order of the fetched result.
+            output: 'dict' for the parsed response, 'raw' for the response body.
 
         Returns:
             dict: Response from the server.
@@ -237,53 +398,95 @@ class Market(NobitexRoute):
             'srcCurrency': src_currency.symbol if src_currency is not None else None,
             'dstCurrency': dst_currency.symbol if dst_currency is not None else None,
             'fromId': from_id,
+            'order': order,
         }
         get_parms = {k: v for k, v in get_parms.items() if v is not None}
 
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route('trades', 'list'),
-            get_parms=get_parms,
+        self._check_output(output, 'dict', 'raw')
+        return self._output(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route('trades', 'list'),
+                get_parms=get_parms,
+                raw=output == 'raw',
+            ),
+            output,
         )
 
-    def get_stats(
+    def iter_trades_list(
             self,
             src_currency: Optional[Currency] = None,
             dst_currency: Optional[Currency] = None,
-        ) -> dict:
+            from_id: int = 1,
+        ) -> PrefetchIterator[List[dict]]:
         """
-        Get market stats.
+        Iterate the list of trades page by page, ordered by id.
+        The next page is fetched in the background while the current one is consumed.
+        `cursor` of the returned iterator is the fromId of the next page, pass it as `from_id` to resume.
 
         Args:
             src_currency: Source currency.
             dst_currency: Destination currency.
+            from_id: Fetch results from this ID.
+
+        Yields:
+            List[dict]: Trades of a page.
+        """
+        def request(cursor: int) -> dict:
+            return self.get_trades_list(src_currency, dst_currency, from_id=cursor, order='id')
+
+        return self._paginate_ids(request, 'trades', from_id)
+
+    def get_stats(
+            self,
+            src_currency: Optional[Currency | Iterable[Currency]] = None,
+            dst_currency: Optional[Currency | Iterable[Currency]] = None,
+            output: ResponseOutput = 'dict',
+        ) -> dict | bytes | Dict[str, MarketStats] | StatsTable:
+        """
+        Get market stats.
+        Several source and destination currencies return the stats of every combination in one call.
+
+        Args:
+            src_currency: Source currency or currencies.
+            dst_currency: Destination currency or currencies.
+            output: 'dict' for the parsed response, 'raw' for the response body, 'model' for MarketStats keyed by market,
+                'array' for a StatsTable of every market.
 
         Returns:
             dict: Response from the server.
         """
 
         get_parms = {
-            'srcCurrency': src_currency.symbol if src_currency is not None else None,
-            'dstCurrency': dst_currency.symbol if dst_currency is not None else None,
+            'srcCurrency': _symbols(src_currency),
+            'dstCurrency': _symbols(dst_currency),
         }
         get_parms = {k: v for k, v in get_parms.items() if v is not None}
-        
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route('stats'),
-            get_parms=get_parms,
+
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._output(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route('stats'),
+                get_parms=get_parms,
+                raw=output == 'raw',
+            ),
+            output,
+            MarketStats.from_response,
+            StatsTable.from_response,
         )
 
     def get_udf_history(
             self,
             symbol: Currency,
             against: CurrencyAgainstMode,
-            resolution: Literal['1', '5', '15', '30','60', '180', '240', '360', '720', 'D','2D', '3D'],
+            resolution: UdfResolution,
             to: int,
             fr: int = None,
             count_back: int = None,
             page: int = None,
-            ) -> dict:
+            output: ResponseOutput = 'dict',
+            ) -> dict | bytes:
         """
         Get UDF history.
 
@@ -294,6 +497,7 @@ class Market(NobitexRoute):
             fr: From timestamp.
             count_back: Count back.
             page: Page number.
+            output: 'dict' for the parsed response, 'raw' for the response body.
         
         Returns:
             dict: Response from the server.
@@ -308,12 +512,67 @@ class Market(NobitexRoute):
             }
         get_parms = {k: v for k, v in get_parms.items() if v is not None}
 
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route('udf', 'history'),
-            get_parms=get_parms,
+        self._check_output(output, 'dict', 'raw')
+        return self._output(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route('udf', 'history'),
+                get_parms=get_parms,
+                raw=output == 'raw',
+            ),
+            output,
         )
 
+    def iter_udf_history(
+            self,
+            symbol: Currency,
+            against: CurrencyAgainstMode,
+            resolution: UdfResolution,
+            start: int,
+            end: Optional[int] = None,
+            bars_per_request: int = 500,
+            output: Literal['dict', 'array'] = 'dict',
+            ) -> PrefetchIterator[dict]:
+        """
+        Iterate UDF history of a time range in server sized windows.
+        The next window is fetched in the background while the current one is consumed,
+        so memory stays flat whatever the length of the range.
+
+        Args:
+            symbol: Symbol.
+            against: Market quote currency.
+            resolution: Resolution.
+            start: From timestamp.
+            end: To timestamp. Defaults to now.
+            bars_per_request: Number of bars requested per window. Defaults to 500.
+            output: 'dict' for column lists, 'array' for numpy arrays.
+
+        Yields:
+            dict: Column chunks keyed by 't', 'o', 'h', 'l', 'c' and 'v'. Windows without data are skipped.
+        """
+        self._check_output(output, 'dict', 'array')
+        step = _UDF_RESOLUTION_SECONDS[resolution] * bars_per_request
+        end = int(time.time()) if end is None else end
+
+        def fetch(window_start: int):
+            if window_start > end:
+                # Resumed from the cursor of a finished iteration
+                return None, window_start, False
+            window_end = min(window_start + step - 1, end)
+            data = self.get_udf_history(symbol, against, resolution, to=window_end, fr=window_start)
+
+            status = data.get('s')
+            if status not in ('ok', 'no_data'):
+                raise NobitexException(f"udf/history error --> Response:{data}")
+
+            chunk = None
+            if status == 'ok' and data.get('t'):
+                chunk = candles_to_arrays(data) if output == 'array' else {column: data[column] for column in CANDLE_COLUMNS}
+
+            return chunk, window_end + 1, window_end < end
+
+        return self._paginate(fetch, start)
+
     def get_global_stats(self) -> dict:
         """
         Get global market stats.
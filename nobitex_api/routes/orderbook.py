@@ -1,7 +1,11 @@
 # nobitex_api\routes\orderbook.py
+from typing import Dict, List
 from ._base import NobitexRoute
 from nobitex_api._currency import Currency
-from nobitex_api._type_hints import CurrencyAgainstMode
+from nobitex_api._order_book import OrderBook
+from nobitex_api._arrays import book_to_arrays
+from nobitex_api._models import BookSnapshot
+from nobitex_api._type_hints import CurrencyAgainstMode, ResponseOutput
 
 """
 https://api.nobitex.ir/v3/orderbook #Done
@@ -18,18 +22,71 @@ class Orderbook(NobitexRoute):
             self, 
             currency: Currency,
             against: CurrencyAgainstMode = 'irt',
-            ) -> dict:
+            output: ResponseOutput = 'dict',
+            ) -> dict | bytes:
         """
         Get orderbook data for a specific currency.
 
         Args:
             Currency (CurrencyEnum): Currency to get orderbook data for.
             against (CurrencyMode, optional): Currency to get orderbook data against. Defaults to 'irt'
+            output (ResponseOutput, optional): 'dict' for the parsed response, 'raw' for the response body, 'model' for a BookSnapshot, 'array' for BookArrays. Defaults to 'dict'
         Returns:
             dict: Orderbook data.
         """
 
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route(currency.get(against)),
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._output(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route(currency.get(against)),
+                raw=output == 'raw',
+            ),
+            output,
+            BookSnapshot.from_response,
+            book_to_arrays,
         )
+
+    def sync_book(
+            self,
+            book: OrderBook,
+        ) -> int:
+        """
+        Fetch the latest orderbook of the book's market and apply it on the book.
+
+        Args:
+            book (OrderBook): Local order book, must have a currency.
+
+        Returns:
+            int: Number of changed price levels.
+        """
+        if book.currency is None:
+            raise ValueError('OrderBook has no currency to sync')
+
+        return self._client._chain(
+            self.get_orders(book.currency, book.against),
+            book.update,
+        )
+
+    def get_orders_batch(
+            self,
+            currencies: List[Currency],
+            against: CurrencyAgainstMode = 'irt',
+            max_workers: int = 10,
+            output: ResponseOutput = 'dict',
+        ) -> Dict[str, dict | bytes | Exception]:
+        """
+        Get orderbook data for several currencies concurrently.
+
+        Args:
+            currencies (List[Currency]): Currencies to get orderbook data for.
+            against (CurrencyAgainstMode, optional): The currency to get orderbook data against. Defaults to 'irt'
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 10.
+            output (ResponseOutput, optional): Output mode of each response, see `get_orders`. Defaults to 'dict'
+
+        Returns:
+            Dict[str, dict | Exception]: Orderbook data or the raised error, keyed by market symbol.
+        """
+
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._batch(self.get_orders, currencies, against, max_workers, output=output)
@@ -18,10 +18,13 @@ class Security(NobitexRoute):
             self,
         ) -> str:
 
-        return self._client._send_request(
-            method='POST',
-            route=self._create_route('anti-phishing')
-        ).get('antiPhishingCode')
+        return self._client._chain(
+            self._client._send_request(
+                method='POST',
+                route=self._create_route('anti-phishing')
+            ),
+            lambda data: data.get('antiPhishingCode'),
+        )
 
     def set_anti_phishing(
             self,
@@ -1,7 +1,10 @@
 # nobitex_api\routes\trades.py
+from typing import Dict, List
 from ._base import NobitexRoute
 from nobitex_api._currency import Currency
-from nobitex_api._type_hints import CurrencyAgainstMode
+from nobitex_api._arrays import trades_to_array
+from nobitex_api._models import Trade
+from nobitex_api._type_hints import CurrencyAgainstMode, ResponseOutput
 
 """
 https://api.nobitex.ir/v2/trades/ #Done
@@ -18,18 +21,50 @@ class Trades(NobitexRoute):
             self, 
             currency: Currency,
             against: CurrencyAgainstMode = 'irt',
-            ) -> dict:
+            output: ResponseOutput = 'dict',
+            ) -> dict | bytes:
         """
         Get trades data for a specific currency.
 
         Args:
             Currency (CurrencyEnum): Currency to get trades data for.
             against (CurrencyMode, optional): Currency to get trades data against. Defaults to 'irt'
+            output (ResponseOutput, optional): 'dict' for the parsed response, 'raw' for the response body, 'model' for a list of Trade, 'array' for a structured trades array. Defaults to 'dict'
         Returns:
             dict: trades data.
         """
 
-        return self._client._send_request(
-            method='GET',
-            route=self._create_route(currency.get(against)),
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._output(
+            self._client._send_request(
+                method='GET',
+                route=self._create_route(currency.get(against)),
+                raw=output == 'raw',
+            ),
+            output,
+            Trade.from_response,
+            trades_to_array,
         )
+
+    def get_trades_batch(
+            self,
+            currencies: List[Currency],
+            against: CurrencyAgainstMode = 'irt',
+            max_workers: int = 10,
+            output: ResponseOutput = 'dict',
+        ) -> Dict[str, dict | bytes | Exception]:
+        """
+        Get trades data for several currencies concurrently.
+
+        Args:
+            currencies (List[Currency]): Currencies to get trades data for.
+            against (CurrencyAgainstMode, optional): The currency to get trades data against. Defaults to 'irt'
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 10.
+            output (ResponseOutput, optional): Output mode of each response, see `get_trades`. Defaults to 'dict'
+
+        Returns:
+            Dict[str, dict | Exception]: Trades data or the raised error, keyed by market symbol.
+        """
+
+        self._check_output(output, 'dict', 'raw', 'model', 'array')
+        return self._batch(self.get_trades, currencies, against, max_workers, output=output)
@@ -13,6 +13,12 @@ setup(
         'requests==2.32.3',
         'requests_cache==1.2.1',
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'websocket': ['websockets'],
+        'fast': ['orjson'],
+        'numpy': ['numpy'],
+    },
     packages=find_packages(),
     include_package_data=True,
     zip_safe=False,
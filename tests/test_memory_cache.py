@@ -0,0 +1,77 @@
+# tests\test_memory_cache.py
+import json, os, tempfile, threading, time, unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nobitex_api import CachePolicy, NobitexClient
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.server.calls += 1
+        body = json.dumps({'status': 'ok', 'stats': {}, 'call': self.server.calls}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+class TwoTierCacheTest(unittest.TestCase):
+    """
+    The memory tier in front of a sqlite cache keeps the age of the responses it gets from it.
+    """
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.calls = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache_dir.cleanup()
+
+    def _client(self, memory: bool) -> NobitexClient:
+        client = NobitexClient(token='token', api_url=f'http://127.0.0.1:{self.server.server_address[1]}')
+        client.enable_caching(cache_name=os.path.join(self.cache_dir.name, 'cache'))
+        client.set_cache_policies({'/market/stats': CachePolicy(2, stale_while_revalidate=3)})
+        if memory:
+            client.enable_memory_cache()
+        return client
+
+    def test_persistent_hit_keeps_its_age(self) -> None:
+        self._client(memory=False).Market.get_stats()
+        time.sleep(1.5)
+
+        client = self._client(memory=True)
+        self.assertEqual(client.Market.get_stats()['call'], 1)
+        self.assertEqual(self.server.calls, 1)
+
+        # Soft TTL of 2s and hard TTL of 5s counted from the creation 1.5s ago, not from the memory insertion
+        (fresh_until, expires_at, _, _), = client._memory_cache._entries.values()
+        now = time.monotonic()
+        self.assertAlmostEqual(fresh_until - now, 0.5, delta=0.25)
+        self.assertAlmostEqual(expires_at - now, 3.5, delta=0.25)
+
+        time.sleep(0.75)
+        self.assertEqual(client.Market.get_stats()['call'], 1)
+        self.assertEqual(client.get_memory_cache_stats()['stale_hits'], 1)
+
+    def test_fresh_entry_is_capped_by_the_persistent_copy(self) -> None:
+        client = self._client(memory=True)
+        # The persistent copy expires after 1s although the memory tier would keep it fresh for 2s
+        client._send_request('GET', '/market/stats', expire_after=1)
+        client._memory_cache.clear()
+        time.sleep(0.5)
+
+        client.Market.get_stats()
+        (fresh_until, _, _, _), = client._memory_cache._entries.values()
+        self.assertAlmostEqual(fresh_until - time.monotonic(), 0.5, delta=0.25)
+
+if __name__ == '__main__':
+    unittest.main()